@@ -2,8 +2,19 @@ import json
 import os
 import sys
 import time
+import shutil
+import socket
 import subprocess
-from urllib import request, parse, error
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
 
 API = os.environ.get('API', 'http://127.0.0.1:8000')
 TOKEN = os.environ.get('TOKEN', 'test-admin')
@@ -12,49 +23,165 @@ EVID = os.path.join('docs', 'delivery', 'LO-PBI-001', 'test_evidence')
 HEADERS = {
     'Authorization': f'Bearer {TOKEN}'
 }
+MAX_WORKERS = 8
 JSON_CT = {'Content-Type': 'application/json'}
 
+# One pooled session for every call so keep-alive reuses the same socket
+# instead of paying a TCP handshake per request.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
 def http_get(path: str, headers=None, timeout=10) -> str:
-    url = f"{API}{path}"
-    req = request.Request(url, headers=headers or {})
-    with request.urlopen(req, timeout=timeout) as resp:
-        return resp.read().decode('utf-8', errors='replace')
-
-
-def http_post(path: str, body: dict, headers=None, timeout=15) -> str:
-    url = f"{API}{path}"
-    data = json.dumps(body).encode('utf-8')
-    hdrs = {}
-    if headers:
-        hdrs.update(headers)
-    hdrs.update(JSON_CT)
-    req = request.Request(url, data=data, headers=hdrs, method='POST')
-    with request.urlopen(req, timeout=timeout) as resp:
-        return resp.read().decode('utf-8', errors='replace')
-
-
-def print_and_save(title: str, content: str, filename: str):
-    print(f"=== {title} ===")
-    print(content)
-    with open(os.path.join(EVID, filename), 'w', encoding='utf-8') as f:
-        f.write(content)
-
-
-def wait_ready(timeout_s=20) -> bool:
+    resp = SESSION.get(f"{API}{path}", headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content.decode('utf-8', errors='replace')
+
+
+def http_get_to_file(path: str, dest: str, headers=None, timeout=10) -> None:
+    # Copy the raw body to disk without decoding it into a Python str
+    with SESSION.get(f"{API}{path}", headers=headers, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        with open(dest, 'wb') as f:
+            shutil.copyfileobj(resp.raw, f)
+
+
+def encode_json(body: dict) -> bytes:
+    return json.dumps(body, separators=(',', ':')).encode('utf-8')
+
+
+def http_post(path: str, data: bytes, headers=None, timeout=15) -> str:
+    hdrs = {**(headers or {}), **JSON_CT}
+    resp = SESSION.post(f"{API}{path}", data=data, headers=hdrs, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content.decode('utf-8', errors='replace')
+
+
+# (method, path, body, title, filename) for every evidence call. The calls
+# are independent of each other, so they are dispatched concurrently.
+CALLS = [
+    # Admin (health is fetched by wait_ready and reused, see main)
+    ('GET', '/api/v1/admin/health', None, 'Admin Health', 'admin_health.json'),
+    ('GET', '/api/v1/admin/metrics', None, 'Admin Metrics', 'admin_metrics.json'),
+    ('GET', '/api/v1/admin/datasets', None, 'Admin Datasets', 'admin_datasets.json'),
+    # Datasets
+    ('GET', '/api/v1/datasets', None, 'Datasets List', 'datasets_list.json'),
+    ('POST', '/api/v1/datasets/caselaw/search', {
+        "keywords": ["arbitration"],
+        "fields": ["title", "body"],
+        "date_range": {"from": None, "to": None},
+        "limit": 2,
+    }, 'Dataset Search', 'dataset_search.json'),
+    ('POST', '/api/v1/datasets/caselaw/semantic_search',
+     {"query": "contract breach damages", "limit": 2},
+     'Dataset Semantic Search', 'dataset_semantic.json'),
+    # Export (streamed straight to disk)
+    ('DOWNLOAD', '/api/v1/export/datasets/caselaw/csv', None, 'Export CSV', 'export.csv'),
+    ('DOWNLOAD', '/api/v1/export/datasets/caselaw/json', None, 'Export JSON', 'export.json'),
+    # Caselaw
+    ('GET', '/api/v1/caselaw/stats', None, 'Caselaw Stats', 'caselaw_stats.json'),
+    ('GET', '/api/v1/caselaw/case/CASE1', None, 'Caselaw Case', 'caselaw_case.json'),
+    ('POST', '/api/v1/caselaw/filter-search',
+     {"filters": {"jurisdiction": ["US-CA"]}, "limit": 1},
+     'Caselaw Filter Search', 'caselaw_filter.json'),
+    ('POST', '/api/v1/caselaw/similarity-search',
+     {"query": "precedent for arbitration clause"},
+     'Caselaw Similarity', 'caselaw_similarity.json'),
+    ('POST', '/api/v1/caselaw/judge-analysis',
+     {"judge_name": "Hon. Jane Doe"},
+     'Caselaw Judge Analysis', 'caselaw_judge.json'),
+    # Core
+    ('POST', '/api/v1/outcome/predict', {
+        "case_type": "civil",
+        "jurisdiction": "US-CA",
+        "key_facts": ["contract breach"],
+        "judge_id": None,
+    }, 'Outcome Predict', 'outcome_predict.json'),
+    ('POST', '/api/v1/strategy/optimize',
+     {"case_id": "stub-123", "strategies": ["settlement", "motion"]},
+     'Strategy Optimize', 'strategy_optimize.json'),
+    ('POST', '/api/v1/simulation/run', {
+        "case_id": "stub-123",
+        "strategy": "settlement",
+        "opponent_type": None,
+        "simulation_parameters": {},
+    }, 'Simulation Run', 'simulation_run.json'),
+    ('GET', '/api/v1/trends/forecast?industry=fintech&jurisdictions=US,EU&time_horizon=12m',
+     None, 'Trends Forecast', 'trends_forecast.json'),
+    ('GET', '/api/v1/jurisdiction/optimize?case_type=civil&key_facts=contract%20breach&preferred_outcome=win',
+     None, 'Jurisdiction Optimize', 'jurisdiction_optimize.json'),
+    ('POST', '/api/v1/compliance/optimize', {
+        "jurisdiction": None,
+        "industry": "fintech",
+        "requirements": ["KYC", "AML"],
+        "risk_tolerance": "medium",
+    }, 'Compliance Optimize', 'compliance_optimize.json'),
+]
+
+# Encode the POST bodies once, compactly, so http_post sends ready-made bytes
+CALLS = [
+    (method, path, encode_json(body) if body is not None else None, title, filename)
+    for method, path, body, title, filename in CALLS
+]
+
+
+def do_call(method: str, path: str, body: Optional[bytes], title: str, filename: str):
+    if method == 'POST':
+        content = http_post(path, body, headers=HEADERS)
+    elif method == 'DOWNLOAD':
+        # Body is already on disk; leave None so print_and_save only summarises it
+        http_get_to_file(path, os.path.join(EVID, filename), headers=HEADERS)
+        content = None
+    else:
+        content = http_get(path, headers=HEADERS)
+    return title, content, filename
+
+
+def print_and_save(results: dict) -> None:
+    # Write every evidence file once all calls are done, then emit the
+    # console output as a single write in CALLS order.
+    out = []
+    for title, filename in ((c[3], c[4]) for c in CALLS):
+        content = results[filename]
+        dest = Path(EVID, filename)
+        if content is None:
+            content = f"[{dest.stat().st_size} bytes written to {filename}]"
+        else:
+            dest.write_text(content, encoding='utf-8')
+        out.append(f"=== {title} ===\n{content}\n")
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+
+def wait_ready(timeout_s=20) -> Optional[str]:
+    # Probe the listening socket with exponential backoff (50ms -> 500ms cap)
+    # and only issue a real HTTP request once uvicorn accepts connections.
+    addr = urlsplit(API)
+    host, port = addr.hostname, addr.port or 80
     deadline = time.time() + timeout_s
+    delay = 0.05
     while time.time() < deadline:
         try:
+            socket.create_connection((host, port), timeout=0.2).close()
             c = http_get('/api/v1/admin/health')
             if c:
-                return True
+                return c
         except Exception:
-            time.sleep(0.5)
-    return False
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return None
+
+
+def drain_output(stream, buf: deque) -> None:
+    # Runs on a daemon thread so log capture never blocks the main flow
+    for line in stream:
+        buf.append(line)
 
 
 def main():
@@ -64,116 +191,32 @@ def main():
     print('Starting server...')
     proc = subprocess.Popen([
         sys.executable, '-m', 'uvicorn', 'stub_api.main:app', '--host', '127.0.0.1', '--port', '8000'
-    ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    server_log = deque(maxlen=200)
+    threading.Thread(target=drain_output, args=(proc.stdout, server_log), daemon=True).start()
 
     try:
-        if not wait_ready(30):
+        health = wait_ready(30)
+        if not health:
             print('Server not ready, server logs:')
-            try:
-                out = proc.stdout.read(4096)
-                if out:
-                    print(out)
-            except Exception:
-                pass
+            print(''.join(server_log))
             raise SystemExit(1)
 
-        # Admin
-        c = http_get('/api/v1/admin/health')
-        print_and_save('Admin Health', c, 'admin_health.json')
-
-        c = http_get('/api/v1/admin/metrics', headers=HEADERS)
-        print_and_save('Admin Metrics', c, 'admin_metrics.json')
-
-        c = http_get('/api/v1/admin/datasets', headers=HEADERS)
-        print_and_save('Admin Datasets', c, 'admin_datasets.json')
-
-        # Datasets
-        c = http_get('/api/v1/datasets', headers=HEADERS)
-        print_and_save('Datasets List', c, 'datasets_list.json')
-
-        body1 = {
-            "keywords": ["arbitration"],
-            "fields": ["title", "body"],
-            "date_range": {"from": None, "to": None},
-            "limit": 2,
-        }
-        c = http_post('/api/v1/datasets/caselaw/search', body1, headers=HEADERS)
-        print_and_save('Dataset Search', c, 'dataset_search.json')
-
-        body2 = {"query": "contract breach damages", "limit": 2}
-        c = http_post('/api/v1/datasets/caselaw/semantic_search', body2, headers=HEADERS)
-        print_and_save('Dataset Semantic Search', c, 'dataset_semantic.json')
-
-        # Export
-        c = http_get('/api/v1/export/datasets/caselaw/csv', headers=HEADERS)
-        print_and_save('Export CSV', c, 'export.csv')
-
-        c = http_get('/api/v1/export/datasets/caselaw/json', headers=HEADERS)
-        print_and_save('Export JSON', c, 'export.json')
-
-        # Caselaw
-        c = http_get('/api/v1/caselaw/stats', headers=HEADERS)
-        print_and_save('Caselaw Stats', c, 'caselaw_stats.json')
-
-        c = http_get('/api/v1/caselaw/case/CASE1', headers=HEADERS)
-        print_and_save('Caselaw Case', c, 'caselaw_case.json')
-
-        body3 = {"filters": {"jurisdiction": ["US-CA"]}, "limit": 1}
-        c = http_post('/api/v1/caselaw/filter-search', body3, headers=HEADERS)
-        print_and_save('Caselaw Filter Search', c, 'caselaw_filter.json')
-
-        body4 = {"query": "precedent for arbitration clause"}
-        c = http_post('/api/v1/caselaw/similarity-search', body4, headers=HEADERS)
-        print_and_save('Caselaw Similarity', c, 'caselaw_similarity.json')
-
-        body5 = {"judge_name": "Hon. Jane Doe"}
-        c = http_post('/api/v1/caselaw/judge-analysis', body5, headers=HEADERS)
-        print_and_save('Caselaw Judge Analysis', c, 'caselaw_judge.json')
-
-        # Core
-        body6 = {
-            "case_type": "civil",
-            "jurisdiction": "US-CA",
-            "key_facts": ["contract breach"],
-            "judge_id": None,
-        }
-        c = http_post('/api/v1/outcome/predict', body6, headers=HEADERS)
-        print_and_save('Outcome Predict', c, 'outcome_predict.json')
-
-        body7 = {"case_id": "stub-123", "strategies": ["settlement", "motion"]}
-        c = http_post('/api/v1/strategy/optimize', body7, headers=HEADERS)
-        print_and_save('Strategy Optimize', c, 'strategy_optimize.json')
-
-        body8 = {
-            "case_id": "stub-123",
-            "strategy": "settlement",
-            "opponent_type": None,
-            "simulation_parameters": {},
-        }
-        c = http_post('/api/v1/simulation/run', body8, headers=HEADERS)
-        print_and_save('Simulation Run', c, 'simulation_run.json')
-
-        c = http_get('/api/v1/trends/forecast?industry=fintech&jurisdictions=US,EU&time_horizon=12m', headers=HEADERS)
-        print_and_save('Trends Forecast', c, 'trends_forecast.json')
-
-        c = http_get('/api/v1/jurisdiction/optimize?case_type=civil&key_facts=contract%20breach&preferred_outcome=win', headers=HEADERS)
-        print_and_save('Jurisdiction Optimize', c, 'jurisdiction_optimize.json')
-
-        body9 = {
-            "jurisdiction": None,
-            "industry": "fintech",
-            "requirements": ["KYC", "AML"],
-            "risk_tolerance": "medium",
-        }
-        c = http_post('/api/v1/compliance/optimize', body9, headers=HEADERS)
-        print_and_save('Compliance Optimize', c, 'compliance_optimize.json')
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            # The readiness probe already returned the health body
+            futures = [pool.submit(do_call, *call) for call in CALLS[1:]]
+            results = {'admin_health.json': health}
+            for fut in as_completed(futures):
+                _, content, filename = fut.result()
+                results[filename] = content
+        print_and_save(results)
 
         print('OK')
 
-    except error.HTTPError as e:
-        print(f"HTTPError: {e.code} {e.reason}")
+    except requests.HTTPError as e:
+        print(f"HTTPError: {e.response.status_code} {e.response.reason}")
         try:
-            print(e.read().decode('utf-8', errors='replace'))
+            print(e.response.content.decode('utf-8', errors='replace'))
         except Exception:
             pass
         sys.exit(1)
@@ -181,6 +224,7 @@ def main():
         print(f"Error: {e}")
         sys.exit(1)
     finally:
+        SESSION.close()
         try:
             proc.terminate()
         except Exception:
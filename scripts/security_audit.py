@@ -5,6 +5,57 @@ Security Audit - Comprehensive security validation before deployment
 import os
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Compiled once at import and reused for every file scanned
+HARDCODED_SECRET_RE = re.compile(r'(password|secret|key)\s*=\s*["\'][^"\']{10,}["\']', re.IGNORECASE)
+# Frontend files are scanned as raw bytes with one pass covering every pattern
+FRONTEND_SCAN_RE = re.compile(
+    rb'(?P<secret>(api[_-]?key|secret|token)\s*[:=]\s*["\'][A-Za-z0-9]{20,}["\'])'
+    rb'|(?P<srv>service_role)',
+    re.IGNORECASE
+)
+# Cheap substring pre-filters: a file can only match the regexes above if it
+# contains one of these (lowercased) tokens, which is the rare case
+HARDCODED_SECRET_TRIGGERS = ('password', 'secret', 'key')
+FRONTEND_TRIGGERS = (b'key', b'secret', b'token', b'service_role')
+FRONTEND_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+FRONTEND_SKIP_DIRS = frozenset({'node_modules', 'dist'})
+MAX_WORKERS = os.cpu_count() or 4
+
+def iter_source_files(root):
+    """Lazily yield frontend source file paths under root in one walk"""
+    for dirpath, dirs, files in os.walk(root):
+        # Pruning in place means skipped directories are never entered
+        dirs[:] = sorted(d for d in dirs if d not in FRONTEND_SKIP_DIRS)
+        for name in sorted(files):
+            if name.endswith(FRONTEND_EXTENSIONS):
+                yield os.path.join(dirpath, name)
+
+def read_text(filepath):
+    """Read a text file, returning None if it does not exist"""
+    try:
+        with open(filepath, 'r') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def read_files(paths):
+    """Read independent files concurrently, preserving input order"""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        return list(pool.map(read_text, paths))
+
+def scan_frontend_file(filepath):
+    """Return the set of pattern groups matched in a frontend file"""
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return set()
+    lowered = data.lower()
+    if not any(t in lowered for t in FRONTEND_TRIGGERS):
+        return set()
+    return {m.lastgroup for m in FRONTEND_SCAN_RE.finditer(data)}
 
 def check_env_files():
     """Check for exposed secrets and proper .env configuration"""
@@ -22,27 +73,25 @@ def check_env_files():
         "legal-oracle-client/.env.local"
     ]
     
-    for env_file in env_files:
-        if os.path.exists(env_file):
+    for env_file, content in zip(env_files, read_files(env_files)):
+        if content is not None:
             print(f"\n[CHECKING] {env_file}")
-            with open(env_file, 'r') as f:
-                content = f.read()
-                
-                # Check for exposed secrets
-                if "SUPABASE_SERVICE_ROLE_KEY" in content and len(content.split("SUPABASE_SERVICE_ROLE_KEY=")[1].split()[0]) > 20:
-                    warnings.append(f"{env_file}: Contains service role key (should only be in backend)")
-                
-                if "OPENAI_API_KEY" in content and "sk-" in content:
-                    warnings.append(f"{env_file}: Contains OpenAI API key")
-                
-                if "GEMINI_API_KEY" in content and len(content.split("GEMINI_API_KEY=")[1].split()[0]) > 20:
-                    warnings.append(f"{env_file}: Contains Gemini API key")
-                
-                # Check for placeholder values
-                if "your-" in content.lower() or "placeholder" in content.lower():
-                    warnings.append(f"{env_file}: Contains placeholder values (update before production)")
-                
-                print(f"  [OK] File checked")
+            
+            # Check for exposed secrets
+            if "SUPABASE_SERVICE_ROLE_KEY" in content and len(content.split("SUPABASE_SERVICE_ROLE_KEY=")[1].split()[0]) > 20:
+                warnings.append(f"{env_file}: Contains service role key (should only be in backend)")
+            
+            if "OPENAI_API_KEY" in content and "sk-" in content:
+                warnings.append(f"{env_file}: Contains OpenAI API key")
+            
+            if "GEMINI_API_KEY" in content and len(content.split("GEMINI_API_KEY=")[1].split()[0]) > 20:
+                warnings.append(f"{env_file}: Contains Gemini API key")
+            
+            # Check for placeholder values
+            if "your-" in content.lower() or "placeholder" in content.lower():
+                warnings.append(f"{env_file}: Contains placeholder values (update before production)")
+            
+            print(f"  [OK] File checked")
         else:
             print(f"\n[MISSING] {env_file}")
     
@@ -97,7 +146,8 @@ def check_api_security():
                 print("  [OK] Authentication function present")
             
             # Check for hardcoded secrets
-            if re.search(r'(password|secret|key)\s*=\s*["\'][^"\']{10,}["\']', content, re.IGNORECASE):
+            lowered = content.lower()
+            if any(t in lowered for t in HARDCODED_SECRET_TRIGGERS) and HARDCODED_SECRET_RE.search(content):
                 issues.append("Possible hardcoded secrets found")
             else:
                 print("  [OK] No hardcoded secrets detected")
@@ -107,7 +157,7 @@ def check_api_security():
                 warnings.append("Possible SQL injection risk - verify all queries use parameterization")
             
             # Check rate limiting
-            if "rate_limit" not in content.lower() and "slowapi" not in content.lower():
+            if "rate_limit" not in lowered and "slowapi" not in lowered:
                 warnings.append("No rate limiting detected - consider adding for production")
     
     return issues, warnings
@@ -121,32 +171,32 @@ def check_frontend_security():
     issues = []
     warnings = []
     
-    # Check for exposed API keys in frontend
-    frontend_files = []
-    for root, dirs, files in os.walk("legal-oracle-client/src"):
-        for file in files:
-            if file.endswith(('.tsx', '.ts', '.jsx', '.js')):
-                frontend_files.append(os.path.join(root, file))
+    # Check for exposed API keys and service role references in frontend
+    frontend_files = list(iter_source_files("legal-oracle-client/src"))
     
     print(f"\n[CHECKING] {len(frontend_files)} frontend files")
     
     exposed_secrets = []
-    for filepath in frontend_files[:50]:  # Limit to avoid too much output
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # Check for API keys
-                if re.search(r'(api[_-]?key|secret|token)\s*[:=]\s*["\'][A-Za-z0-9]{20,}["\']', content, re.IGNORECASE):
-                    exposed_secrets.append(os.path.basename(filepath))
-        except:
-            pass
+    service_role_refs = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = list(pool.map(scan_frontend_file, frontend_files))
+    
+    for filepath, found in zip(frontend_files, results):
+        if 'secret' in found:
+            exposed_secrets.append(os.path.basename(filepath))
+        if 'srv' in found:
+            service_role_refs.append(os.path.basename(filepath))
     
     if exposed_secrets:
         issues.append(f"Possible exposed secrets in frontend: {', '.join(exposed_secrets[:5])}")
     else:
         print("  [OK] No obvious secrets in frontend")
     
+    if service_role_refs:
+        issues.append(f"Frontend contains service role key reference - CRITICAL! ({', '.join(service_role_refs[:5])})")
+    else:
+        print("  [OK] No service role key in frontend")
+    
     # Check supabase.ts
     supabase_ts = "legal-oracle-client/src/lib/supabase.ts"
     if os.path.exists(supabase_ts):
@@ -159,12 +209,6 @@ def check_frontend_security():
                 print("  [OK] Using VITE_ environment variables")
             else:
                 warnings.append("Supabase client not using VITE_ env vars")
-            
-            # Should NOT have service role key
-            if "service_role" in content.lower():
-                issues.append("Frontend contains service role key reference - CRITICAL!")
-            else:
-                print("  [OK] No service role key in frontend")
     
     return issues, warnings
 
@@ -183,21 +227,19 @@ def check_database_security():
         "docs/delivery/LO-PBI-001/sql/002_compliance_framework.sql"
     ]
     
-    for filepath in migration_files:
-        if os.path.exists(filepath):
+    for filepath, content in zip(migration_files, read_files(migration_files)):
+        if content is not None:
             print(f"\n[CHECKING] {filepath}")
-            with open(filepath, 'r') as f:
-                content = f.read()
-                
-                # Check for RLS policies
-                if "ENABLE ROW LEVEL SECURITY" in content.upper():
-                    print("  [OK] RLS enabled")
-                else:
-                    warnings.append(f"{os.path.basename(filepath)}: No RLS policies found")
-                
-                # Check for public access
-                if "GRANT ALL" in content.upper() and "PUBLIC" in content.upper():
-                    warnings.append(f"{os.path.basename(filepath)}: Public GRANT found - verify necessity")
+            
+            # Check for RLS policies
+            if "ENABLE ROW LEVEL SECURITY" in content.upper():
+                print("  [OK] RLS enabled")
+            else:
+                warnings.append(f"{os.path.basename(filepath)}: No RLS policies found")
+            
+            # Check for public access
+            if "GRANT ALL" in content.upper() and "PUBLIC" in content.upper():
+                warnings.append(f"{os.path.basename(filepath)}: Public GRANT found - verify necessity")
     
     return issues, warnings
 
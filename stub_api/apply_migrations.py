@@ -5,6 +5,7 @@ Uses Supabase SQL Editor or direct PostgreSQL connection
 """
 import os
 import sys
+import shutil
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,6 +17,11 @@ def get_sql_files():
         ("Compliance Framework", "../docs/delivery/LO-PBI-001/sql/002_compliance_framework.sql")
     ]
 
+def _count_lines(filepath):
+    """Line count of a migration file, ignoring leading/trailing blank lines"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return f.read().strip().count('\n') + 1
+
 def display_sql_instructions():
     """Display instructions for manual SQL execution"""
     print("\n" + "=" * 70)
@@ -42,9 +48,7 @@ def display_sql_instructions():
         print(f"   File: {abs_path}")
         
         if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.read().strip().split('\n')
-                print(f"   Lines: {len(lines)}")
+            print(f"   Lines: {_count_lines(filepath)}")
         else:
             print(f"   [WARNING] File not found!")
     
@@ -109,10 +113,11 @@ def print_sql_files():
         print(f"{'='*70}\n")
         
         if os.path.exists(filepath):
+            # Stream straight to stdout instead of buffering the whole file
             with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                print(content)
-                print(f"\n/* END OF {name} */\n")
+                shutil.copyfileobj(f, sys.stdout)
+            sys.stdout.write("\n")
+            print(f"\n/* END OF {name} */\n")
         else:
             print(f"[ERROR] File not found: {filepath}\n")
 
@@ -8,18 +8,137 @@ Date: 2025-10-07
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 from dataclasses import dataclass
+from collections import defaultdict
+from operator import attrgetter
+from functools import lru_cache
 import re
+from uuid import uuid4
+
+try:
+    import numpy as np
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Free-text expiration date ("expires on", "until", "through" + date),
+# fused into one alternation so the abstract is scanned in a single pass
+_EXPIRY_RE = re.compile(
+    r"(?:expire[sd]?\s+on|until|through)\s+"
+    r"(?P<month>\w+)\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})",
+    re.IGNORECASE
+)
+
+# English month names and abbreviations, so matched dates are built
+# directly instead of going through locale-dependent strptime("%B")
+_MONTHS = {}
+for _number, _name in enumerate((
+    "january", "february", "march", "april", "may", "june", "july",
+    "august", "september", "october", "november", "december"
+), start=1):
+    _MONTHS[_name] = _number
+    _MONTHS[_name[:3]] = _number
+_MONTHS["sept"] = 9
+
+# Opportunity score bonus by Federal Register document type
+_IMPACT_BONUS = {"PRORULE": 0.1, "RULE": 0.2}
+
+# Case outcomes that make a jurisdiction a favorable venue
+_FAVORABLE_OUTCOMES = frozenset({"Plaintiff Victory", "Settlement (Favorable)"})
+
+# Keyword indicators per opportunity category
+_CATEGORY_KEYWORDS = {
+    "sunset": (
+        "sunset", "expiration", "expire", "temporary",
+        "pilot program", "interim", "transition period"
+    ),
+    "exemption": (
+        "exemption", "exception", "waiver", "relief",
+        "temporary relief", "interim relief"
+    ),
+    "transition": (
+        "transition", "grandfathered", "phase-in",
+        "implementation period", "compliance deadline"
+    ),
+}
+
+# Every keyword of every category in one multi-pattern scanner. The
+# lookahead reports the longest keyword starting at each position, and each
+# keyword maps to the categories of all keywords it contains, so a single
+# pass over the text finds every category present (overlaps included).
+# Matching is case-insensitive (ASCII keywords), so content is not lowercased.
+_ALL_KEYWORDS = sorted(
+    {k for keywords in _CATEGORY_KEYWORDS.values() for k in keywords},
+    key=len, reverse=True
+)
+_KEYWORD_SCAN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in _ALL_KEYWORDS) + "))",
+    re.IGNORECASE | re.ASCII
+)
+_KEYWORD_CATEGORIES = {
+    keyword: frozenset(
+        category
+        for category, keywords in _CATEGORY_KEYWORDS.items()
+        if any(k in keyword for k in keywords)
+    )
+    for keyword in _ALL_KEYWORDS
+}
+
+# Any-keyword test used to pre-filter large batches in vectorized form
+_KEYWORD_ANY_RE = re.compile(
+    "|".join(re.escape(k) for k in _ALL_KEYWORDS),
+    re.IGNORECASE | re.ASCII
+)
+# Batch size above which the keyword pre-filter runs through pandas
+_VECTORIZE_MIN_BATCH = 1000
+
+
+def _parse_iso_date(value) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD field, returning None when missing or malformed"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _keyword_candidates(regulations: List[Dict]) -> List[Dict]:
+    """
+    Return only the regulations whose title or abstract contains any
+    keyword, using pandas' vectorized string matching over the batch
+    """
+    texts = pd.Series([
+        reg.get("title", "") + " " + reg.get("abstract", "")
+        for reg in regulations
+    ])
+    mask = texts.str.contains(_KEYWORD_ANY_RE, regex=True, na=False).to_numpy()
+    return [regulations[i] for i in np.flatnonzero(mask)]
+
+
+def _scan_keywords(content: str) -> set:
+    """Return the set of keyword categories present in content (any case)"""
+    categories = set()
+    for match in _KEYWORD_SCAN_RE.finditer(content):
+        categories |= _KEYWORD_CATEGORIES[match.group(1).lower()]
+    return categories
 
-@dataclass
+
+@dataclass(frozen=True)
 class ArbitrageOpportunity:
     """Data class for arbitrage opportunities"""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10; we support 3.9)
+    __slots__ = (
+        "id", "type", "title", "description", "opportunity_score", "window_days",
+        "expiration_date", "jurisdictions", "recommendation", "risk_level", "detected_at"
+    )
+    
     id: str
     type: str
     title: str
@@ -43,291 +162,349 @@ class ArbitrageMonitor:
         self.alert_subscriptions = {}
         self.opportunities_cache = []
     
-    def detect_sunset_clauses(self, regulations: List[Dict]) -> List[ArbitrageOpportunity]:
+    def detect_sunset_clauses(
+        self,
+        regulations: List[Dict],
+        now: Optional[datetime] = None
+    ) -> List[ArbitrageOpportunity]:
         """
         Detect regulations with sunset/expiration clauses
         
         Args:
             regulations: List of regulation documents
+            now: Reference time for the scan (defaults to current time)
         
         Returns:
             List of arbitrage opportunities
         """
-        opportunities = []
-        
-        for reg in regulations:
-            title = reg.get("title", "").lower()
-            abstract = reg.get("abstract", "").lower()
-            content = title + " " + abstract
-            
-            # Look for sunset indicators
-            sunset_keywords = [
-                "sunset", "expiration", "expire", "temporary",
-                "pilot program", "interim", "transition period"
-            ]
-            
-            has_sunset = any(keyword in content for keyword in sunset_keywords)
-            
-            if has_sunset:
-                # Try to extract expiration date
-                expiration_date = self._extract_expiration_date(reg)
-                
-                if expiration_date:
-                    window_days = (expiration_date - datetime.now()).days
-                    
-                    if window_days > 0 and window_days <= 365:  # Only if within next year
-                        opportunity_score = self._calculate_opportunity_score(
-                            window_days=window_days,
-                            impact_level=reg.get("type", "RULE")
-                        )
-                        
-                        opportunities.append(ArbitrageOpportunity(
-                            id=reg.get("document_number", ""),
-                            type="sunset_clause",
-                            title=reg.get("title", "")[:100],
-                            description=f"Temporary legal framework expiring in {window_days} days",
-                            opportunity_score=opportunity_score,
-                            window_days=window_days,
-                            expiration_date=expiration_date,
-                            jurisdictions=self._extract_jurisdictions(reg),
-                            recommendation=f"Act before {expiration_date.strftime('%Y-%m-%d')} to leverage current rules",
-                            risk_level=self._assess_risk_level(window_days),
-                            detected_at=datetime.now()
-                        ))
-        
-        return opportunities
+        return self._scan_regulations(regulations, now or datetime.now())[0]
     
     def detect_jurisdictional_conflicts(
         self, 
-        case_data: List[Dict]
+        case_data: List[Dict],
+        now: Optional[datetime] = None
     ) -> List[ArbitrageOpportunity]:
         """
         Detect conflicting rulings across jurisdictions (circuit splits)
         
         Args:
             case_data: List of case outcomes
+            now: Reference time for the scan (defaults to current time)
         
         Returns:
             List of arbitrage opportunities
         """
+        now = now or datetime.now()
         opportunities = []
         
         # Group cases by legal issue
-        issue_groups = {}
+        issue_groups = defaultdict(list)
         for case in case_data:
-            issue = case.get("case_type", "Unknown")
-            if issue not in issue_groups:
-                issue_groups[issue] = []
-            issue_groups[issue].append(case)
+            issue_groups[case.get("case_type", "Unknown")].append(case)
         
         # Check for conflicts
         for issue, cases in issue_groups.items():
-            jurisdictions = set(c.get("jurisdiction", "") for c in cases)
+            # Collect jurisdictions, outcomes and favorable venues in one sweep
+            jurisdictions = set()
+            outcomes = set()
+            favorable_jurisdictions = []
+            for c in cases:
+                jurisdictions.add(c.get("jurisdiction", ""))
+                outcome = c.get("outcome", "")
+                outcomes.add(outcome)
+                if outcome in _FAVORABLE_OUTCOMES:
+                    favorable_jurisdictions.append(c.get("jurisdiction"))
             
-            if len(jurisdictions) > 1:
-                # Check if outcomes differ
-                outcomes = [c.get("outcome", "") for c in cases]
+            # Conflicting outcomes across more than one jurisdiction, with
+            # at least one favorable venue to file in
+            if len(jurisdictions) > 1 and len(outcomes) > 1 and favorable_jurisdictions:
+                opportunity_score = min(0.95, 0.6 + (len(favorable_jurisdictions) * 0.1))
                 
-                if len(set(outcomes)) > 1:  # Conflicting outcomes
-                    # Calculate opportunity score
-                    favorable_jurisdictions = [
-                        c.get("jurisdiction") 
-                        for c in cases 
-                        if c.get("outcome") in ["Plaintiff Victory", "Settlement (Favorable)"]
-                    ]
-                    
-                    if favorable_jurisdictions:
-                        opportunity_score = min(0.95, 0.6 + (len(favorable_jurisdictions) * 0.1))
-                        
-                        opportunities.append(ArbitrageOpportunity(
-                            id=f"conflict_{issue}_{datetime.now().timestamp()}",
-                            type="jurisdictional_conflict",
-                            title=f"Circuit Split: {issue}",
-                            description=f"Different rulings on {issue} across {len(jurisdictions)} jurisdictions",
-                            opportunity_score=opportunity_score,
-                            window_days=180,  # Estimated window before harmonization
-                            expiration_date=datetime.now() + timedelta(days=180),
-                            jurisdictions=favorable_jurisdictions[:3],
-                            recommendation=f"File in {favorable_jurisdictions[0]} before circuit split is resolved",
-                            risk_level="medium",
-                            detected_at=datetime.now()
-                        ))
+                opportunities.append(ArbitrageOpportunity(
+                    id=f"conflict_{issue}_{uuid4().hex[:12]}",
+                    type="jurisdictional_conflict",
+                    title=f"Circuit Split: {issue}",
+                    description=f"Different rulings on {issue} across {len(jurisdictions)} jurisdictions",
+                    opportunity_score=opportunity_score,
+                    window_days=180,  # Estimated window before harmonization
+                    expiration_date=now + timedelta(days=180),
+                    jurisdictions=favorable_jurisdictions[:3],
+                    recommendation=f"File in {favorable_jurisdictions[0]} before circuit split is resolved",
+                    risk_level="medium",
+                    detected_at=now
+                ))
         
         return opportunities
     
-    def detect_temporary_exemptions(self, regulations: List[Dict]) -> List[ArbitrageOpportunity]:
+    def detect_temporary_exemptions(
+        self,
+        regulations: List[Dict],
+        now: Optional[datetime] = None
+    ) -> List[ArbitrageOpportunity]:
         """
         Detect temporary regulatory exemptions
         """
-        opportunities = []
-        
-        for reg in regulations:
-            content = (reg.get("title", "") + " " + reg.get("abstract", "")).lower()
-            
-            # Look for exemption keywords
-            exemption_keywords = [
-                "exemption", "exception", "waiver", "relief",
-                "temporary relief", "interim relief"
-            ]
-            
-            if any(keyword in content for keyword in exemption_keywords):
-                # This is a potential exemption
-                expiration_date = self._extract_expiration_date(reg)
-                
-                if expiration_date:
-                    window_days = (expiration_date - datetime.now()).days
-                    
-                    if 0 < window_days <= 365:
-                        opportunities.append(ArbitrageOpportunity(
-                            id=reg.get("document_number", ""),
-                            type="temporary_exemption",
-                            title=reg.get("title", "")[:100],
-                            description="Temporary regulatory relief available",
-                            opportunity_score=0.75,
-                            window_days=window_days,
-                            expiration_date=expiration_date,
-                            jurisdictions=self._extract_jurisdictions(reg),
-                            recommendation="Apply for exemption before window closes",
-                            risk_level=self._assess_risk_level(window_days),
-                            detected_at=datetime.now()
-                        ))
-        
-        return opportunities
+        return self._scan_regulations(regulations, now or datetime.now())[1]
     
-    def detect_transition_periods(self, regulations: List[Dict]) -> List[ArbitrageOpportunity]:
+    def detect_transition_periods(
+        self,
+        regulations: List[Dict],
+        now: Optional[datetime] = None
+    ) -> List[ArbitrageOpportunity]:
         """
         Detect regulatory transition periods with dual-regime advantages
         """
-        opportunities = []
+        return self._scan_regulations(regulations, now or datetime.now())[2]
+    
+    def _sunset_opportunity(
+        self,
+        reg: Dict,
+        expiration_date: Optional[datetime],
+        jurisdictions: List[str],
+        now: datetime
+    ) -> Optional[ArbitrageOpportunity]:
+        """Build a sunset clause opportunity for a keyword-matched regulation"""
+        if expiration_date:
+            window_days = expiration_date.toordinal() - now.toordinal()
+            
+            if window_days > 0 and window_days <= 365:  # Only if within next year
+                opportunity_score = self._calculate_opportunity_score(
+                    window_days=window_days,
+                    impact_level=reg.get("type", "RULE")
+                )
+                
+                return ArbitrageOpportunity(
+                    id=reg.get("document_number", ""),
+                    type="sunset_clause",
+                    title=reg.get("title", "")[:100],
+                    description=f"Temporary legal framework expiring in {window_days} days",
+                    opportunity_score=opportunity_score,
+                    window_days=window_days,
+                    expiration_date=expiration_date,
+                    jurisdictions=jurisdictions,
+                    recommendation=f"Act before {expiration_date.strftime('%Y-%m-%d')} to leverage current rules",
+                    risk_level=self._assess_risk_level(window_days),
+                    detected_at=now
+                )
         
-        for reg in regulations:
-            content = (reg.get("title", "") + " " + reg.get("abstract", "")).lower()
+        return None
+    
+    def _exemption_opportunity(
+        self,
+        reg: Dict,
+        expiration_date: Optional[datetime],
+        jurisdictions: List[str],
+        now: datetime
+    ) -> Optional[ArbitrageOpportunity]:
+        """Build a temporary exemption opportunity for a keyword-matched regulation"""
+        if expiration_date:
+            window_days = expiration_date.toordinal() - now.toordinal()
             
-            # Look for transition indicators
-            transition_keywords = [
-                "transition", "grandfathered", "phase-in",
-                "implementation period", "compliance deadline"
-            ]
+            if 0 < window_days <= 365:
+                return ArbitrageOpportunity(
+                    id=reg.get("document_number", ""),
+                    type="temporary_exemption",
+                    title=reg.get("title", "")[:100],
+                    description="Temporary regulatory relief available",
+                    opportunity_score=0.75,
+                    window_days=window_days,
+                    expiration_date=expiration_date,
+                    jurisdictions=jurisdictions,
+                    recommendation="Apply for exemption before window closes",
+                    risk_level=self._assess_risk_level(window_days),
+                    detected_at=now
+                )
+        
+        return None
+    
+    def _transition_opportunity(
+        self,
+        reg: Dict,
+        jurisdictions: List[str],
+        now: datetime
+    ) -> Optional[ArbitrageOpportunity]:
+        """Build a transition period opportunity for a keyword-matched regulation"""
+        # Estimate transition window
+        effective_dt = _parse_iso_date(reg.get("effective_on"))
+        
+        if effective_dt:
+            window_days = effective_dt.toordinal() - now.toordinal()
             
-            if any(keyword in content for keyword in transition_keywords):
-                effective_date = reg.get("effective_on")
-                comments_close = reg.get("comments_close_on")
-                
-                # Estimate transition window
-                if effective_date:
-                    try:
-                        effective_dt = datetime.strptime(effective_date, "%Y-%m-%d")
-                        window_days = (effective_dt - datetime.now()).days
-                        
-                        if 0 < window_days <= 365:
-                            opportunities.append(ArbitrageOpportunity(
-                                id=reg.get("document_number", ""),
-                                type="transition_period",
-                                title=reg.get("title", "")[:100],
-                                description="Regulatory transition period offers dual-regime flexibility",
-                                opportunity_score=0.70,
-                                window_days=window_days,
-                                expiration_date=effective_dt,
-                                jurisdictions=self._extract_jurisdictions(reg),
-                                recommendation="Leverage old rules during transition before new requirements take effect",
-                                risk_level="low",
-                                detected_at=datetime.now()
-                            ))
-                    except:
-                        pass
+            if 0 < window_days <= 365:
+                return ArbitrageOpportunity(
+                    id=reg.get("document_number", ""),
+                    type="transition_period",
+                    title=reg.get("title", "")[:100],
+                    description="Regulatory transition period offers dual-regime flexibility",
+                    opportunity_score=0.70,
+                    window_days=window_days,
+                    expiration_date=effective_dt,
+                    jurisdictions=jurisdictions,
+                    recommendation="Leverage old rules during transition before new requirements take effect",
+                    risk_level="low",
+                    detected_at=now
+                )
         
-        return opportunities
+        return None
     
     def _extract_expiration_date(self, regulation: Dict) -> Optional[datetime]:
         """
         Try to extract expiration date from regulation
         """
         # Check structured fields first
-        if regulation.get("effective_on"):
-            try:
-                return datetime.strptime(regulation["effective_on"], "%Y-%m-%d")
-            except:
-                pass
+        effective_on = _parse_iso_date(regulation.get("effective_on"))
+        if effective_on:
+            return effective_on
         
-        if regulation.get("comments_close_on"):
-            try:
-                # Use comments close as proxy
-                return datetime.strptime(regulation["comments_close_on"], "%Y-%m-%d")
-            except:
-                pass
+        # Use comments close as proxy
+        comments_close_on = _parse_iso_date(regulation.get("comments_close_on"))
+        if comments_close_on:
+            return comments_close_on
         
         # Try to parse from text
         content = regulation.get("abstract", "")
         
         # Look for date patterns
-        date_patterns = [
-            r"expire[sd]?\s+on\s+(\w+\s+\d{1,2},?\s+\d{4})",
-            r"until\s+(\w+\s+\d{1,2},?\s+\d{4})",
-            r"through\s+(\w+\s+\d{1,2},?\s+\d{4})"
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    date_str = match.group(1)
-                    # Try to parse (simplified)
-                    return datetime.strptime(date_str, "%B %d, %Y")
-                except:
-                    continue
+        for match in _EXPIRY_RE.finditer(content):
+            month = _MONTHS.get(match.group("month").lower())
+            if month is None:
+                continue
+            try:
+                return datetime(int(match.group("year")), month, int(match.group("day")))
+            except ValueError:
+                continue
         
         return None
     
     def _extract_jurisdictions(self, regulation: Dict) -> List[str]:
         """Extract affected jurisdictions"""
-        jurisdictions = []
-        
         # Get from agencies
-        agencies = regulation.get("agencies", [])
-        for agency in agencies:
-            name = agency.get("name", "")
-            if "Federal" in name or "National" in name:
-                jurisdictions.append("Federal")
-            else:
-                jurisdictions.append(name[:30])
+        jurisdictions = [
+            self._classify_agency(agency.get("name", ""))
+            for agency in regulation.get("agencies", ())
+        ]
         
-        return jurisdictions if jurisdictions else ["Federal"]
+        return jurisdictions or ["Federal"]
     
-    def _calculate_opportunity_score(
-        self, 
-        window_days: int,
-        impact_level: str
-    ) -> float:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classify_agency(name: str) -> str:
+        """Map an agency name to its jurisdiction (agencies repeat across batches)"""
+        if "Federal" in name or "National" in name:
+            return "Federal"
+        return name[:30]
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _calculate_opportunity_score(window_days: int, impact_level: str) -> float:
         """
         Calculate opportunity score (0-1)
+        
+        Inputs are a small day count and a document type, so results are
+        memoized.
         """
-        # Base score
-        score = 0.5
-        
-        # Window factor (shorter window = higher urgency)
-        if window_days < 30:
-            score += 0.3
-        elif window_days < 90:
-            score += 0.2
-        elif window_days < 180:
-            score += 0.1
-        
-        # Impact factor
-        if impact_level == "PRORULE":  # Proposed rule
-            score += 0.1
-        elif impact_level == "RULE":  # Final rule
-            score += 0.2
+        # Base score + window factor (shorter window = higher urgency)
+        score = 0.5 + (
+            0.3 if window_days < 30 else
+            0.2 if window_days < 90 else
+            0.1 if window_days < 180 else
+            0.0
+        )
+        
+        # Impact factor (proposed rule / final rule)
+        score += _IMPACT_BONUS.get(impact_level, 0.0)
         
         return min(score, 1.0)
     
-    def _assess_risk_level(self, window_days: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _assess_risk_level(window_days: int) -> str:
         """Assess risk level based on window"""
-        if window_days < 30:
-            return "high"  # Urgent
-        elif window_days < 90:
-            return "medium"
-        else:
-            return "low"
+        return "high" if window_days < 30 else "medium" if window_days < 90 else "low"
+    
+    def _preprocess(
+        self,
+        regulations: List[Dict]
+    ) -> List[Tuple[set, Optional[datetime], List[str], Dict]]:
+        """
+        Reduce regulations to the fields the detectors need, computed once
+        
+        Returns:
+            (categories, expiration_date, jurisdictions, regulation) tuples,
+            only for regulations matching at least one keyword category
+        """
+        prepared = []
+        
+        # Regulation batches can repeat a document (overlapping queries or
+        # pages); memoize the per-document extraction for this scan
+        jurisdiction_cache: Dict[str, List[str]] = {}
+        expiration_cache: Dict[str, Optional[datetime]] = {}
+        
+        # Large batches (e.g. a full Federal Register day) are narrowed to
+        # keyword hits up front; the per-regulation loop only sees those
+        if PANDAS_AVAILABLE and len(regulations) >= _VECTORIZE_MIN_BATCH:
+            regulations = _keyword_candidates(regulations)
+        
+        for reg in regulations:
+            doc_number = reg.get("document_number")
+            content = reg.get("title", "") + " " + reg.get("abstract", "")
+            categories = _scan_keywords(content)
+            
+            # Most regulations match no category; skip all extraction work
+            if not categories:
+                continue
+            
+            if doc_number in jurisdiction_cache:
+                jurisdictions = jurisdiction_cache[doc_number]
+            else:
+                jurisdictions = self._extract_jurisdictions(reg)
+                if doc_number:
+                    jurisdiction_cache[doc_number] = jurisdictions
+            
+            expiration_date = None
+            if "sunset" in categories or "exemption" in categories:
+                if doc_number in expiration_cache:
+                    expiration_date = expiration_cache[doc_number]
+                else:
+                    expiration_date = self._extract_expiration_date(reg)
+                    if doc_number:
+                        expiration_cache[doc_number] = expiration_date
+            
+            prepared.append((categories, expiration_date, jurisdictions, reg))
+        
+        return prepared
+    
+    def _scan_regulations(
+        self,
+        regulations: List[Dict],
+        now: datetime
+    ) -> Tuple[List[ArbitrageOpportunity], List[ArbitrageOpportunity], List[ArbitrageOpportunity]]:
+        """
+        Single fused pass over the preprocessed regulations, emitting every
+        category each one matches
+        
+        Returns:
+            (sunset, exemption, transition) opportunity lists
+        """
+        sunset, exemptions, transitions = [], [], []
+        
+        for categories, expiration_date, jurisdictions, reg in self._preprocess(regulations):
+            if "sunset" in categories:
+                opportunity = self._sunset_opportunity(reg, expiration_date, jurisdictions, now)
+                if opportunity:
+                    sunset.append(opportunity)
+            
+            if "exemption" in categories:
+                opportunity = self._exemption_opportunity(reg, expiration_date, jurisdictions, now)
+                if opportunity:
+                    exemptions.append(opportunity)
+            
+            if "transition" in categories:
+                opportunity = self._transition_opportunity(reg, jurisdictions, now)
+                if opportunity:
+                    transitions.append(opportunity)
+        
+        return sunset, exemptions, transitions
     
     async def scan_for_opportunities(
         self,
@@ -344,16 +521,21 @@ class ArbitrageMonitor:
         Returns:
             List of opportunities sorted by score
         """
-        all_opportunities = []
+        # One reference time for the whole scan keeps windows and
+        # detected_at consistent across opportunities
+        now = datetime.now()
+        
+        # The regulation scan and the case conflict scan are independent and
+        # CPU-bound; run them off the event loop concurrently
+        (sunset, exemptions, transitions), conflicts = await asyncio.gather(
+            asyncio.to_thread(self._scan_regulations, regulations, now),
+            asyncio.to_thread(self.detect_jurisdictional_conflicts, case_data, now)
+        )
         
-        # Run all detection methods
-        all_opportunities.extend(self.detect_sunset_clauses(regulations))
-        all_opportunities.extend(self.detect_jurisdictional_conflicts(case_data))
-        all_opportunities.extend(self.detect_temporary_exemptions(regulations))
-        all_opportunities.extend(self.detect_transition_periods(regulations))
+        all_opportunities = sunset + conflicts + exemptions + transitions
         
         # Sort by opportunity score
-        all_opportunities.sort(key=lambda x: x.opportunity_score, reverse=True)
+        all_opportunities.sort(key=attrgetter("opportunity_score"), reverse=True)
         
         # Cache for future reference
         self.opportunities_cache = all_opportunities
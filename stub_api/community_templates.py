@@ -13,12 +13,28 @@ Features:
 """
 
 import os
+import sys
 import json
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
-import hashlib
+from functools import lru_cache
+from collections import deque
+from itertools import islice
+import secrets
+import heapq
+import threading
+from bisect import bisect_left, insort
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class TemplateCategory(str, Enum):
     CIVIL_LITIGATION = "civil_litigation"
@@ -33,6 +49,12 @@ class TemplateCategory(str, Enum):
     BANKRUPTCY = "bankruptcy"
     OTHER = "other"
 
+# get_categories() response, built once at import
+_CATEGORIES = tuple(
+    {"id": cat.value, "name": cat.name.replace("_", " ").title()}
+    for cat in TemplateCategory
+)
+
 class TemplateStatus(str, Enum):
     DRAFT = "draft"
     PENDING_REVIEW = "pending_review"
@@ -45,27 +67,99 @@ class PricingModel(str, Enum):
     ONE_TIME = "one_time"
     SUBSCRIPTION = "subscription"
 
-@dataclass
+_INT8_INFO = np.iinfo(np.int8)
+
+def _fits_int8(values: np.ndarray) -> bool:
+    """True if every value is a whole number that int8 holds exactly."""
+    return bool(
+        values.size
+        and values.min() >= _INT8_INFO.min
+        and values.max() <= _INT8_INFO.max
+        and np.array_equal(values, np.round(values))
+    )
+
+def _shared_payoffs(p1: Any, p2: Any) -> Optional[np.ndarray]:
+    """The read-only (2, n, m) array p1 and p2 are the two planes of, if any.
+    
+    Lets matrices built from the frozen sample constants (or another
+    GameMatrix) share one array instead of copying it.
+    """
+    base = getattr(p1, "base", None)
+    if (
+        isinstance(base, np.ndarray)
+        and getattr(p2, "base", None) is base
+        and base.ndim == 3
+        and base.shape[0] == 2
+        and not base.flags.writeable
+        and p1.__array_interface__ == base[0].__array_interface__
+        and p2.__array_interface__ == base[1].__array_interface__
+    ):
+        return base
+    return None
+
+# Explicit __slots__ throughout (dataclass(slots=True) needs Python 3.10)
+@dataclass(frozen=True)
 class GameMatrix:
     """Represents the game theory matrix in a template"""
+    # payoffs is a plain slot filled in by __post_init__, not a dataclass field
+    __slots__ = (
+        "players", "strategies", "payoff_matrix_p1", "payoff_matrix_p2",
+        "variables", "default_values", "payoffs"
+    )
+
     players: List[str]
     strategies: List[List[str]]  # [[P1 strategies], [P2 strategies]]
-    payoff_matrix_p1: List[List[float]]
-    payoff_matrix_p2: List[List[float]]
+    payoff_matrix_p1: np.ndarray
+    payoff_matrix_p2: np.ndarray
     variables: Dict[str, Any]  # Configurable variables
     default_values: Dict[str, float]
 
-@dataclass
+    def __post_init__(self):
+        # Both players' payoffs live in one contiguous block so solvers can
+        # work on whole matrices; the p1/p2 fields are views of it. Whole-number
+        # payoffs (the usual 0-100 scores) are stored as int8, anything else
+        # stays float64 so no precision is lost
+        payoffs = _shared_payoffs(self.payoff_matrix_p1, self.payoff_matrix_p2)
+        if payoffs is None:
+            p1 = np.asarray(self.payoff_matrix_p1, dtype=np.float64)
+            p2 = np.asarray(self.payoff_matrix_p2, dtype=np.float64)
+            if p1.ndim != 2 or p1.shape != p2.shape:
+                raise ValueError(f"Payoff matrices must be 2-D with equal shapes, got {p1.shape} and {p2.shape}")
+            payoffs = np.stack((p1, p2))  # (2, n, m): [P1, P2]
+            if _fits_int8(payoffs):
+                payoffs = payoffs.astype(np.int8)
+            payoffs.flags.writeable = False  # frozen like the dataclass itself
+        object.__setattr__(self, "payoffs", payoffs)
+        object.__setattr__(self, "payoff_matrix_p1", payoffs[0])
+        object.__setattr__(self, "payoff_matrix_p2", payoffs[1])
+
+@dataclass(frozen=True)
 class TemplateMetadata:
+    __slots__ = ("jurisdiction", "case_types", "complexity", "estimated_time", "prerequisites", "tags")
+
     jurisdiction: str
     case_types: List[str]
     complexity: str  # simple, medium, complex
     estimated_time: str  # e.g., "15 minutes"
     prerequisites: List[str]
-    tags: List[str]
+    tags: Tuple[str, ...]
+
+    def __post_init__(self):
+        # The same few jurisdictions, complexities and tags repeat across
+        # templates; interning shares one string object for each
+        object.__setattr__(self, "jurisdiction", sys.intern(self.jurisdiction))
+        object.__setattr__(self, "complexity", sys.intern(self.complexity))
+        object.__setattr__(self, "tags", tuple(sys.intern(t) for t in self.tags))
 
 @dataclass
 class CommunityTemplate:
+    __slots__ = (
+        "id", "author_id", "author_name", "title", "description", "category", "status",
+        "pricing_model", "price", "game_matrix", "metadata", "instructions", "sample_scenario",
+        "version", "created_at", "updated_at", "published_at", "downloads", "rating",
+        "review_count", "revenue_share"
+    )
+
     id: str
     author_id: str
     author_name: str
@@ -80,16 +174,24 @@ class CommunityTemplate:
     instructions: str  # How to use the template
     sample_scenario: Optional[str]
     version: str
-    created_at: str
-    updated_at: str
-    published_at: Optional[str]
+    created_at: int  # ns since the epoch, see _iso()
+    updated_at: int
+    published_at: Optional[int]
     downloads: int
     rating: float
     review_count: int
     revenue_share: float  # Platform takes 30%, author gets 70%
 
-@dataclass 
+    def __post_init__(self):
+        self.author_name = sys.intern(self.author_name)
+
+@dataclass(frozen=True)
 class TemplateReview:
+    __slots__ = (
+        "id", "template_id", "user_id", "user_name", "rating", "review_text",
+        "helpful_count", "created_at"
+    )
+
     id: str
     template_id: str
     user_id: str
@@ -97,33 +199,172 @@ class TemplateReview:
     rating: int  # 1-5
     review_text: str
     helpful_count: int
-    created_at: str
+    created_at: int  # ns since the epoch
 
-@dataclass
+@dataclass(frozen=True)
 class TemplatePurchase:
+    __slots__ = (
+        "id", "template_id", "user_id", "price_paid", "author_revenue",
+        "platform_revenue", "purchased_at"
+    )
+
     id: str
     template_id: str
     user_id: str
     price_paid: float
     author_revenue: float
     platform_revenue: float
-    purchased_at: str
+    purchased_at: int  # ns since the epoch
 
 # In-memory storage (use database in production)
 _templates: Dict[str, CommunityTemplate] = {}
-_reviews: Dict[str, List[TemplateReview]] = {}
+_reviews: Dict[str, deque] = {}  # template_id -> newest MAX_STORED_REVIEWS reviews
 _purchases: Dict[str, List[TemplatePurchase]] = {}
 _user_templates: Dict[str, List[str]] = {}
+# Rating summary over every review ever added, including ones the bounded
+# _reviews buffers have since dropped
+_rating_sum: Dict[str, int] = {}  # template_id -> sum of review ratings
+_review_total: Dict[str, int] = {}  # template_id -> number of reviews
+_user_purchased: Dict[str, Set[str]] = {}  # user_id -> purchased template_ids
+
+# (category, status) -> [(creation seq, template_id)], kept in creation order.
+# Category "*" holds every template with that status. The enums subclass str,
+# so members are used as keys directly and match plain-string lookups.
+_template_seq: Dict[str, int] = {}
+_by_category_status: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+
+# Cached sort orders per (status, category, sort_by), rebuilt lazily after a
+# write invalidates them so list_templates only slices on the read path
+_sorted_index: Dict[Tuple[str, str, str], List[CommunityTemplate]] = {}
+
+# sort_by -> (key, reverse)
+_SORT_KEYS = {
+    "downloads": (lambda t: t.downloads, True),
+    "rating": (lambda t: t.rating, True),
+    "newest": (lambda t: t.published_at or t.created_at, True),
+    "price_low": (lambda t: t.price, False),
+    "price_high": (lambda t: t.price, True),
+}
+
+# Writes to the same template are serialized by one of _LOCK_SHARDS locks
+# picked by template id. _index_lock guards the shared index/sort caches and
+# every change to a field the sort orders read, so a reader never caches an
+# order built from half-applied writes. Lock order: template lock, then index.
+_LOCK_SHARDS = 16
+_template_locks = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
+_index_lock = threading.RLock()
+
+def _template_lock(template_id: str) -> threading.Lock:
+    return _template_locks[hash(template_id) % _LOCK_SHARDS]
+
+MAX_STORED_REVIEWS = 10_000
 
 # Platform revenue share (70% to author, 30% to platform)
 AUTHOR_REVENUE_SHARE = 0.70
 PLATFORM_REVENUE_SHARE = 0.30
 
-def generate_id(prefix: str = "tpl") -> str:
-    """Generate unique ID."""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    random_part = hashlib.md5(f"{timestamp}{os.urandom(8).hex()}".encode()).hexdigest()[:8]
-    return f"{prefix}_{timestamp}_{random_part}"
+def generate_id(prefix: str = "tpl", now_ns: Optional[int] = None) -> str:
+    """Generate unique ID (pass now_ns to reuse the caller's timestamp)."""
+    seconds = None if now_ns is None else now_ns // 1_000_000_000
+    return f"{prefix}_{time.strftime('%Y%m%d%H%M%S', time.localtime(seconds))}_{secrets.token_hex(4)}"
+
+# Timestamps are stored as int ns from time.time_ns() and only formatted
+# when a response dict is built
+_EPOCH = datetime(1970, 1, 1)
+
+def _iso(ns: Optional[int]) -> Optional[str]:
+    """Format an ns timestamp as UTC ISO 8601 with a Z suffix."""
+    if ns is None:
+        return None
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat() + "Z"
+
+def _ns(iso: str) -> int:
+    """Parse a UTC ISO 8601 timestamp (Z suffix) into ns since the epoch."""
+    delta = datetime.fromisoformat(iso.rstrip("Z")) - _EPOCH
+    return (delta // timedelta(microseconds=1)) * 1000
+
+def _register_template(template: CommunityTemplate):
+    """Store a new template and add it to the category/status index."""
+    with _index_lock:
+        _templates[template.id] = template
+        _template_seq[template.id] = len(_template_seq)
+        _index_add(template)
+
+def _index_add(template: CommunityTemplate):
+    entry = (_template_seq[template.id], template.id)
+    for category in (template.category, "*"):
+        insort(_by_category_status.setdefault((category, template.status), []), entry)
+    _invalidate_index(template.status)
+
+def _index_remove(template: CommunityTemplate):
+    entry = (_template_seq[template.id], template.id)
+    for category in (template.category, "*"):
+        bucket = _by_category_status[(category, template.status)]
+        del bucket[bisect_left(bucket, entry)]
+    _invalidate_index(template.status)
+
+def _set_status(template: CommunityTemplate, status: TemplateStatus):
+    """Change a template's status, moving it between index buckets."""
+    with _index_lock:
+        _index_remove(template)
+        template.status = status
+        _index_add(template)
+
+def _invalidate_index(status: Optional[str] = None, sort_by: Optional[str] = None):
+    """Drop cached sort orders touched by a write (all of them by default)."""
+    with _index_lock:
+        if status is None:
+            _sorted_index.clear()
+            return
+        for key in [k for k in _sorted_index if k[0] == status and (sort_by is None or k[2] == sort_by)]:
+            del _sorted_index[key]
+
+def _sorted_templates(status: str, sort_by: str, category: Optional[str] = None) -> List[CommunityTemplate]:
+    """Return templates with the given status (and category) in sort_by order, cached."""
+    key = (status, category or "*", sort_by)
+    ordered = _sorted_index.get(key)
+    if ordered is None:
+        with _index_lock:
+            bucket = _by_category_status.get((key[1], status), ())
+            ordered = [_templates[tid] for _, tid in bucket]
+            spec = _SORT_KEYS.get(sort_by)
+            if spec:
+                ordered.sort(key=spec[0], reverse=spec[1])
+            _sorted_index[key] = ordered
+    return ordered
+
+# Sample payoff matrices, built once as read-only int8 arrays ([P1, P2])
+def _frozen_payoffs(p1: List[List[int]], p2: List[List[int]]) -> np.ndarray:
+    payoffs = np.array([p1, p2], dtype=np.int8)
+    payoffs.flags.writeable = False
+    return payoffs
+
+_TENANT_EVICTION_PAYOFFS = _frozen_payoffs(
+    [[70, 85, 60],
+     [50, 75, 40],
+     [20, 30, 35]],
+    [[30, 40, 80],
+     [60, 50, 70],
+     [90, 85, 75]]
+)
+
+_PI_SETTLEMENT_PAYOFFS = _frozen_payoffs(
+    [[40, 70, 30],
+     [60, 80, 50],
+     [85, 65, 20]],
+    [[80, 50, 90],
+     [60, 40, 70],
+     [30, 55, 95]]
+)
+
+_CONTRACT_BREACH_PAYOFFS = _frozen_payoffs(
+    [[65, 55, 40],
+     [80, 70, 50],
+     [75, 85, 60]],
+    [[35, 45, 60],
+     [20, 30, 50],
+     [45, 35, 55]]
+)
 
 # Sample templates
 def _init_sample_templates():
@@ -145,16 +386,8 @@ def _init_sample_templates():
                     ["Contest Eviction", "Negotiate Settlement", "Vacate Voluntarily"],
                     ["Proceed with Eviction", "Offer Cash for Keys", "Negotiate Lease Terms"]
                 ],
-                payoff_matrix_p1=[
-                    [70, 85, 60],
-                    [50, 75, 40],
-                    [20, 30, 35]
-                ],
-                payoff_matrix_p2=[
-                    [30, 40, 80],
-                    [60, 50, 70],
-                    [90, 85, 75]
-                ],
+                payoff_matrix_p1=_TENANT_EVICTION_PAYOFFS[0],
+                payoff_matrix_p2=_TENANT_EVICTION_PAYOFFS[1],
                 variables={
                     "rent_arrears": "Amount of unpaid rent",
                     "lease_term_remaining": "Months left on lease",
@@ -177,9 +410,9 @@ def _init_sample_templates():
             instructions="1. Enter the current rent arrears amount.\n2. Specify remaining lease term.\n3. Estimate market rate difference.\n4. Review Nash equilibrium for optimal strategy.",
             sample_scenario="Tenant with $5,000 in arrears, 6 months left on lease, rent 15% below market rate.",
             version="1.2.0",
-            created_at="2024-06-15T10:00:00Z",
-            updated_at="2024-11-20T14:30:00Z",
-            published_at="2024-06-20T09:00:00Z",
+            created_at=_ns("2024-06-15T10:00:00Z"),
+            updated_at=_ns("2024-11-20T14:30:00Z"),
+            published_at=_ns("2024-06-20T09:00:00Z"),
             downloads=1247,
             rating=4.6,
             review_count=89,
@@ -201,16 +434,8 @@ def _init_sample_templates():
                     ["Demand Full Value", "Accept Settlement", "File Lawsuit"],
                     ["Lowball Offer", "Fair Settlement", "Deny Claim"]
                 ],
-                payoff_matrix_p1=[
-                    [40, 70, 30],
-                    [60, 80, 50],
-                    [85, 65, 20]
-                ],
-                payoff_matrix_p2=[
-                    [80, 50, 90],
-                    [60, 40, 70],
-                    [30, 55, 95]
-                ],
+                payoff_matrix_p1=_PI_SETTLEMENT_PAYOFFS[0],
+                payoff_matrix_p2=_PI_SETTLEMENT_PAYOFFS[1],
                 variables={
                     "medical_expenses": "Total medical bills",
                     "lost_wages": "Lost income to date",
@@ -235,9 +460,9 @@ def _init_sample_templates():
             instructions="1. Enter total medical expenses.\n2. Calculate lost wages.\n3. Select appropriate pain multiplier.\n4. Rate liability strength.\n5. Run Nash analysis.",
             sample_scenario="Car accident victim with $25K medical bills, $10K lost wages, clear liability.",
             version="2.0.1",
-            created_at="2024-03-10T08:00:00Z",
-            updated_at="2024-10-15T16:00:00Z",
-            published_at="2024-03-15T12:00:00Z",
+            created_at=_ns("2024-03-10T08:00:00Z"),
+            updated_at=_ns("2024-10-15T16:00:00Z"),
+            published_at=_ns("2024-03-15T12:00:00Z"),
             downloads=2834,
             rating=4.8,
             review_count=156,
@@ -259,16 +484,8 @@ def _init_sample_templates():
                     ["Sue for Damages", "Seek Specific Performance", "Negotiate Settlement"],
                     ["Defend on Merits", "Offer Cure", "Settle"]
                 ],
-                payoff_matrix_p1=[
-                    [65, 55, 40],
-                    [80, 70, 50],
-                    [75, 85, 60]
-                ],
-                payoff_matrix_p2=[
-                    [35, 45, 60],
-                    [20, 30, 50],
-                    [45, 35, 55]
-                ],
+                payoff_matrix_p1=_CONTRACT_BREACH_PAYOFFS[0],
+                payoff_matrix_p2=_CONTRACT_BREACH_PAYOFFS[1],
                 variables={
                     "contract_value": "Total contract value",
                     "breach_severity": "Severity of breach (0-1)",
@@ -291,9 +508,9 @@ def _init_sample_templates():
             instructions="1. Enter contract value.\n2. Rate breach severity.\n3. Calculate mitigation costs.\n4. Analyze optimal remedy strategy.",
             sample_scenario="$100K service contract, partial non-performance, $15K mitigation costs.",
             version="1.0.0",
-            created_at="2024-08-01T11:00:00Z",
-            updated_at="2024-08-01T11:00:00Z",
-            published_at="2024-08-05T10:00:00Z",
+            created_at=_ns("2024-08-01T11:00:00Z"),
+            updated_at=_ns("2024-08-01T11:00:00Z"),
+            published_at=_ns("2024-08-05T10:00:00Z"),
             downloads=567,
             rating=4.3,
             review_count=42,
@@ -302,7 +519,7 @@ def _init_sample_templates():
     ]
     
     for template in sample_templates:
-        _templates[template.id] = template
+        _register_template(template)
 
 # Initialize sample data
 _init_sample_templates()
@@ -322,7 +539,8 @@ def create_template(
     sample_scenario: Optional[str] = None
 ) -> CommunityTemplate:
     """Create a new community template."""
-    template_id = generate_id("tpl")
+    now = time.time_ns()
+    template_id = generate_id("tpl", now)
     
     template = CommunityTemplate(
         id=template_id,
@@ -339,8 +557,8 @@ def create_template(
         instructions=instructions,
         sample_scenario=sample_scenario,
         version="1.0.0",
-        created_at=datetime.now().isoformat(),
-        updated_at=datetime.now().isoformat(),
+        created_at=now,
+        updated_at=now,
         published_at=None,
         downloads=0,
         rating=0.0,
@@ -348,11 +566,8 @@ def create_template(
         revenue_share=AUTHOR_REVENUE_SHARE
     )
     
-    _templates[template_id] = template
-    
-    if author_id not in _user_templates:
-        _user_templates[author_id] = []
-    _user_templates[author_id].append(template_id)
+    _register_template(template)
+    _user_templates.setdefault(author_id, []).append(template_id)
     
     return template
 
@@ -365,32 +580,60 @@ def list_templates(
     status: str = "published",
     sort_by: str = "downloads",
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[Tuple[Any, str]] = None
 ) -> List[CommunityTemplate]:
-    """List templates with filtering."""
-    templates = list(_templates.values())
-    
-    # Filter by status
-    templates = [t for t in templates if t.status.value == status]
+    """List templates with filtering.
     
-    # Filter by category
-    if category:
-        templates = [t for t in templates if t.category.value == category]
+    Pass the page_cursor() of the last template on a page as cursor to get
+    the templates that follow it (keyset pagination); offset is then
+    ignored. Cursors need one of the known sort_by orders.
+    """
+    spec = _SORT_KEYS.get(sort_by)
+    if cursor is not None:
+        if not spec:
+            raise ValueError(f"Cursor pagination is not supported for sort_by={sort_by!r}")
+        templates = _sorted_templates(status, sort_by, category)
+        start = _seek(templates, sort_by, cursor)
+        return templates[start:start + limit]
     
-    # Sort
-    if sort_by == "downloads":
-        templates.sort(key=lambda x: x.downloads, reverse=True)
-    elif sort_by == "rating":
-        templates.sort(key=lambda x: x.rating, reverse=True)
-    elif sort_by == "newest":
-        templates.sort(key=lambda x: x.published_at or x.created_at, reverse=True)
-    elif sort_by == "price_low":
-        templates.sort(key=lambda x: x.price)
-    elif sort_by == "price_high":
-        templates.sort(key=lambda x: x.price, reverse=True)
+    if spec and offset == 0 and (status, category or "*", sort_by) not in _sorted_index:
+        # First page with no cached order (e.g. right after a purchase): a
+        # bounded heap is O(n log limit) and avoids sorting the whole bucket
+        with _index_lock:
+            bucket = _by_category_status.get((category or "*", status), ())
+            if 0 < limit < len(bucket) // 4:
+                pick = heapq.nlargest if spec[1] else heapq.nsmallest
+                return pick(limit, (_templates[tid] for _, tid in bucket), key=spec[0])
     
+    templates = _sorted_templates(status, sort_by, category)
     return templates[offset:offset + limit]
 
+def page_cursor(template: CommunityTemplate, sort_by: str = "downloads") -> Tuple[Any, str]:
+    """Cursor for resuming list_templates after this template."""
+    return _SORT_KEYS[sort_by][0](template), template.id
+
+def _seek(ordered: List[CommunityTemplate], sort_by: str, cursor: Tuple[Any, str]) -> int:
+    """Binary search for the first template in ordered that sorts after cursor."""
+    key, reverse = _SORT_KEYS[sort_by]
+    value, template_id = cursor
+    seq = _template_seq.get(template_id, -1)
+    lo, hi = 0, len(ordered)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        t = ordered[mid]
+        v = key(t)
+        if v == value:
+            # Ties keep creation order, so compare creation sequence numbers
+            before = _template_seq[t.id] <= seq
+        else:
+            before = v > value if reverse else v < value
+        if before:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
 def get_user_templates(author_id: str) -> List[CommunityTemplate]:
     """Get all templates by an author."""
     template_ids = _user_templates.get(author_id, [])
@@ -399,21 +642,27 @@ def get_user_templates(author_id: str) -> List[CommunityTemplate]:
 def submit_for_review(template_id: str) -> bool:
     """Submit a template for review."""
     template = _templates.get(template_id)
-    if template and template.status == TemplateStatus.DRAFT:
-        template.status = TemplateStatus.PENDING_REVIEW
-        template.updated_at = datetime.now().isoformat()
+    if not template:
+        return False
+    with _template_lock(template_id):
+        if template.status != TemplateStatus.DRAFT:
+            return False
+        template.updated_at = time.time_ns()
+        _set_status(template, TemplateStatus.PENDING_REVIEW)
         return True
-    return False
 
 def publish_template(template_id: str) -> bool:
     """Publish a template (admin action)."""
     template = _templates.get(template_id)
-    if template and template.status == TemplateStatus.PENDING_REVIEW:
-        template.status = TemplateStatus.PUBLISHED
-        template.published_at = datetime.now().isoformat()
-        template.updated_at = datetime.now().isoformat()
+    if not template:
+        return False
+    with _template_lock(template_id):
+        if template.status != TemplateStatus.PENDING_REVIEW:
+            return False
+        with _index_lock:
+            template.published_at = template.updated_at = time.time_ns()
+            _set_status(template, TemplateStatus.PUBLISHED)
         return True
-    return False
 
 def purchase_template(
     template_id: str,
@@ -421,15 +670,22 @@ def purchase_template(
 ) -> Optional[TemplatePurchase]:
     """Record a template purchase."""
     template = _templates.get(template_id)
-    if not template or template.status != TemplateStatus.PUBLISHED:
+    if not template:
+        return None
+    with _template_lock(template_id):
+        return _record_purchase(template, user_id)
+
+def _record_purchase(template: CommunityTemplate, user_id: str) -> Optional[TemplatePurchase]:
+    template_id = template.id
+    if template.status != TemplateStatus.PUBLISHED:
         return None
     
     # Check if already purchased
-    user_purchases = _purchases.get(user_id, [])
-    if any(p.template_id == template_id for p in user_purchases):
+    if template_id in _user_purchased.get(user_id, ()):
         return None  # Already purchased
     
-    purchase_id = generate_id("pur")
+    now = time.time_ns()
+    purchase_id = generate_id("pur", now)
     author_revenue = template.price * AUTHOR_REVENUE_SHARE
     platform_revenue = template.price * PLATFORM_REVENUE_SHARE
     
@@ -440,15 +696,16 @@ def purchase_template(
         price_paid=template.price,
         author_revenue=author_revenue,
         platform_revenue=platform_revenue,
-        purchased_at=datetime.now().isoformat()
+        purchased_at=now
     )
     
-    if user_id not in _purchases:
-        _purchases[user_id] = []
-    _purchases[user_id].append(purchase)
+    _purchases.setdefault(user_id, []).append(purchase)
+    _user_purchased.setdefault(user_id, set()).add(template_id)
     
     # Increment download count
-    template.downloads += 1
+    with _index_lock:
+        template.downloads += 1
+        _invalidate_index(template.status, "downloads")
     
     return purchase
 
@@ -463,8 +720,19 @@ def add_review(
     template = _templates.get(template_id)
     if not template:
         return None
-    
-    review_id = generate_id("rev")
+    with _template_lock(template_id):
+        return _record_review(template, user_id, user_name, rating, review_text)
+
+def _record_review(
+    template: CommunityTemplate,
+    user_id: str,
+    user_name: str,
+    rating: int,
+    review_text: str
+) -> TemplateReview:
+    template_id = template.id
+    now = time.time_ns()
+    review_id = generate_id("rev", now)
     review = TemplateReview(
         id=review_id,
         template_id=template_id,
@@ -473,27 +741,83 @@ def add_review(
         rating=max(1, min(5, rating)),  # Clamp to 1-5
         review_text=review_text,
         helpful_count=0,
-        created_at=datetime.now().isoformat()
+        created_at=now
     )
     
     if template_id not in _reviews:
-        _reviews[template_id] = []
+        _reviews[template_id] = deque(maxlen=MAX_STORED_REVIEWS)
     _reviews[template_id].append(review)
     
-    # Update template rating
-    all_reviews = _reviews[template_id]
-    template.rating = sum(r.rating for r in all_reviews) / len(all_reviews)
-    template.review_count = len(all_reviews)
+    # Update template rating from the running sum
+    _rating_sum[template_id] = _rating_sum.get(template_id, 0) + review.rating
+    _review_total[template_id] = _review_total.get(template_id, 0) + 1
+    with _index_lock:
+        template.review_count = _review_total[template_id]
+        template.rating = _rating_sum[template_id] / template.review_count
+        _invalidate_index(template.status, "rating")
     
     return review
 
-def get_template_reviews(template_id: str) -> List[TemplateReview]:
-    """Get all reviews for a template."""
-    return _reviews.get(template_id, [])
+def get_template_reviews(
+    template_id: str,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    sort: str = "oldest"
+) -> List[TemplateReview]:
+    """Get reviews for a template, paginated.
+    
+    sort is "oldest" (insertion order), "newest" or "helpful". Only the
+    newest MAX_STORED_REVIEWS reviews are kept per template.
+    """
+    reviews = _reviews.get(template_id)
+    if not reviews:
+        return []
+    stop = None if limit is None else offset + limit
+    # Appends happen under the template lock; hold it so iteration is safe
+    with _template_lock(template_id):
+        if sort == "newest":
+            return list(islice(reversed(reviews), offset, stop))
+        if sort == "helpful":
+            if stop is None:
+                ranked = sorted(reviews, key=lambda r: r.helpful_count, reverse=True)
+            else:
+                ranked = heapq.nlargest(stop, reviews, key=lambda r: r.helpful_count)
+            return ranked[offset:stop]
+        return list(islice(reviews, offset, stop))
 
 # API Response Helpers
 def template_to_dict(template: CommunityTemplate, include_matrix: bool = True) -> Dict[str, Any]:
     """Convert template to dict for API response."""
+    # Built fresh on every call: callers may mutate the nested containers,
+    # so only the immutable JSON bytes (template_to_bytes) are cached
+    return _template_dict(template, include_matrix)
+
+def template_to_bytes(template: CommunityTemplate, include_matrix: bool = True) -> bytes:
+    """Serialize template_to_dict output to JSON bytes for API response."""
+    if _templates.get(template.id) is not template:
+        return _template_json(template, include_matrix)
+    return _cached_template_json(_version_key(template), include_matrix)
+
+def _version_key(template: CommunityTemplate) -> Tuple:
+    # Everything that can change after creation is part of the cache key, so
+    # a write simply misses instead of needing explicit invalidation
+    return (template.id, template.status, template.updated_at, template.downloads,
+            template.rating, template.review_count)
+
+@lru_cache(maxsize=4096)
+def _cached_template_json(version_key: Tuple, include_matrix: bool) -> bytes:
+    return _template_json(_templates[version_key[0]], include_matrix)
+
+def _template_json(template: CommunityTemplate, include_matrix: bool) -> bytes:
+    if ORJSON_AVAILABLE:
+        # orjson writes the payoff arrays directly, no .tolist() round trip
+        return orjson.dumps(
+            _template_dict(template, include_matrix, raw_arrays=True),
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(_template_dict(template, include_matrix)).encode("utf-8")
+
+def _template_dict(template: CommunityTemplate, include_matrix: bool, raw_arrays: bool = False) -> Dict[str, Any]:
     result = {
         "id": template.id,
         "author_id": template.author_id,
@@ -509,23 +833,25 @@ def template_to_dict(template: CommunityTemplate, include_matrix: bool = True) -
             "case_types": template.metadata.case_types,
             "complexity": template.metadata.complexity,
             "estimated_time": template.metadata.estimated_time,
-            "tags": template.metadata.tags
+            "tags": list(template.metadata.tags)
         },
         "version": template.version,
-        "created_at": template.created_at,
-        "updated_at": template.updated_at,
-        "published_at": template.published_at,
+        "created_at": _iso(template.created_at),
+        "updated_at": _iso(template.updated_at),
+        "published_at": _iso(template.published_at),
         "downloads": template.downloads,
         "rating": template.rating,
         "review_count": template.review_count
     }
     
     if include_matrix:
+        p1 = template.game_matrix.payoff_matrix_p1
+        p2 = template.game_matrix.payoff_matrix_p2
         result["game_matrix"] = {
             "players": template.game_matrix.players,
             "strategies": template.game_matrix.strategies,
-            "payoff_matrix_p1": template.game_matrix.payoff_matrix_p1,
-            "payoff_matrix_p2": template.game_matrix.payoff_matrix_p2,
+            "payoff_matrix_p1": p1 if raw_arrays else p1.tolist(),
+            "payoff_matrix_p2": p2 if raw_arrays else p2.tolist(),
             "variables": template.game_matrix.variables,
             "default_values": template.game_matrix.default_values
         }
@@ -542,12 +868,10 @@ def review_to_dict(review: TemplateReview) -> Dict[str, Any]:
         "rating": review.rating,
         "review_text": review.review_text,
         "helpful_count": review.helpful_count,
-        "created_at": review.created_at
+        "created_at": _iso(review.created_at)
     }
 
 def get_categories() -> List[Dict[str, str]]:
     """Get all template categories."""
-    return [
-        {"id": cat.value, "name": cat.name.replace("_", " ").title()}
-        for cat in TemplateCategory
-    ]
+    # Fresh dicts, so callers can't mutate the shared _CATEGORIES entries
+    return [dict(c) for c in _CATEGORIES]
@@ -13,23 +13,87 @@ Free tier: 5,000 requests/day
 """
 
 import os
+import sys
+import math
 import json
-import hashlib
+import time
+import random
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+import asyncio
 import httpx
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Configuration
 COURTLISTENER_API_BASE = "https://www.courtlistener.com/api/rest/v3"
 COURTLISTENER_API_TOKEN = os.getenv("COURTLISTENER_API_TOKEN", "")
+# When set (and redis is installed), the daily rate limit and response cache
+# are shared by every worker through Redis instead of kept per process
+REDIS_URL = os.getenv("REDIS_URL", "")
 
 # Rate limiting cache (in production, use Redis)
-_request_cache: Dict[str, Dict[str, Any]] = {}
-_rate_limit_counter = {"count": 0, "reset_time": datetime.now()}
+# LRU order: oldest entry first, bounded to REQUEST_CACHE_MAX_ENTRIES.
+# Entries are (expires_at on the time.monotonic() clock, data, validators),
+# where validators holds conditional-GET headers for revalidating endpoints.
+_request_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any], Optional[Dict[str, str]]]]" = OrderedDict()
+REQUEST_CACHE_MAX_ENTRIES = 10_000
+# Per-endpoint TTL overrides in seconds; court metadata barely changes
+ENDPOINT_CACHE_TTL = {"courts/": 24 * 3600}
+# Mostly static endpoints whose expired entries are revalidated with
+# If-None-Match/If-Modified-Since instead of refetched
+REVALIDATE_ENDPOINT_PREFIXES = ("courts/", "people/")
+
+# Keys search_opinions reads from each search result; sent as ?fields= so the
+# API omits everything else from the response
+SEARCH_RESULT_FIELDS = ",".join((
+    "id", "caseName", "court", "court_id", "dateFiled", "docketNumber", "citeCount",
+    "status", "precedentialStatus", "absolute_url", "snippet", "judge",
+))
+# "day" is the local date (YYYYMMDD) the count belongs to
+_rate_limit_counter = {"count": 0, "day": time.strftime("%Y%m%d"), "reset_time": datetime.now()}
 DAILY_RATE_LIMIT = 5000
 
+# ETL page fetching: page cap per run and concurrent page requests
+ETL_MAX_PAGES = 10
+ETL_PAGE_CONCURRENCY = 8
+
+# Retries for 429/5xx responses and transport errors: attempts in total,
+# and exponential backoff (seconds) between them
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF_INITIAL = 1.0
+RETRY_BACKOFF_MAX = 30.0
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Shared connection pool, created lazily per event loop (see get_client)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_redis = None
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 the records keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class CourtType(str, Enum):
     FEDERAL_APPELLATE = "federal-appellate"
     FEDERAL_DISTRICT = "federal-district"
@@ -37,7 +101,7 @@ class CourtType(str, Enum):
     STATE_APPELLATE = "state-appellate"
     STATE_TRIAL = "state-trial"
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Opinion:
     id: str
     case_name: str
@@ -52,7 +116,7 @@ class Opinion:
     text_excerpt: Optional[str] = None
     judges: Optional[List[str]] = None
     
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Docket:
     id: str
     case_name: str
@@ -66,33 +130,125 @@ class Docket:
     referred_to_str: str
     absolute_url: str
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SearchResult:
     opinions: List[Opinion]
     count: int
     next_page: Optional[str]
     previous_page: Optional[str]
 
-def _get_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
-    """Generate cache key from endpoint and params."""
-    param_str = json.dumps(params, sort_keys=True)
-    return hashlib.md5(f"{endpoint}:{param_str}".encode()).hexdigest()
+def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, so keep-alive connections are reused."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them; scripts that
+    # call asyncio.run() repeatedly get a fresh client per loop
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            base_url=COURTLISTENER_API_BASE,
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300),
+            headers={"Authorization": f"Token {COURTLISTENER_API_TOKEN}"} if COURTLISTENER_API_TOKEN else {}
+        )
+        _client_loop = loop
+    return _client
+
+def get_redis():
+    """Return the shared Redis client, or None when REDIS_URL/redis is not configured."""
+    global _redis, _redis_loop
+    if not (REDIS_AVAILABLE and REDIS_URL):
+        return None
+    loop = asyncio.get_running_loop()
+    if _redis is None or _redis_loop is not loop:
+        _redis = aioredis.from_url(REDIS_URL)
+        _redis_loop = loop
+    return _redis
+
+async def close_client():
+    """Close the shared AsyncClient and Redis client (call on app shutdown)."""
+    global _client, _client_loop, _redis, _redis_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    if _redis is not None:
+        await _redis.close()
+    _redis = None
+    _redis_loop = None
+
+def _get_cache_key(endpoint: str, params: Dict[str, Any]) -> Tuple:
+    """Generate cache key from endpoint and params (sorted, so order-independent)."""
+    key = (endpoint, tuple(sorted(params.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable param values (lists etc.) are keyed by their repr
+        key = (endpoint, tuple(sorted((k, repr(v)) for k, v in params.items())))
+    return key
+
+def _roll_rate_limit_day():
+    """Reset the counter if the local date has changed since it was last used."""
+    today = time.strftime("%Y%m%d")
+    if today != _rate_limit_counter["day"]:
+        _rate_limit_counter["count"] = 0
+        _rate_limit_counter["day"] = today
+        _rate_limit_counter["reset_time"] = datetime.now()
 
 def _check_rate_limit() -> bool:
     """Check if we're within rate limits."""
-    now = datetime.now()
-    
-    # Reset counter if new day
-    if now.date() > _rate_limit_counter["reset_time"].date():
-        _rate_limit_counter["count"] = 0
-        _rate_limit_counter["reset_time"] = now
-    
+    if _rate_limit_counter["count"] < DAILY_RATE_LIMIT:
+        return True
+    # Only an exhausted counter can be waiting on the next day's reset
+    _roll_rate_limit_day()
     return _rate_limit_counter["count"] < DAILY_RATE_LIMIT
 
 def _increment_rate_limit():
     """Increment rate limit counter."""
+    _roll_rate_limit_day()
     _rate_limit_counter["count"] += 1
 
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retrying; honours a numeric Retry-After header."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_BACKOFF_MAX)
+    return min(RETRY_BACKOFF_INITIAL * 2 ** attempt + random.random(), RETRY_BACKOFF_MAX)
+
+def _validators(response: httpx.Response) -> Optional[Dict[str, str]]:
+    """Conditional-GET headers for revalidating a cached response, if it has any."""
+    validators = {}
+    if "ETag" in response.headers:
+        validators["If-None-Match"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+    return validators or None
+
+async def _get_with_retry(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> httpx.Response:
+    """GET endpoint, retrying rate-limit/server errors with exponential backoff and jitter.
+    
+    A 304 Not Modified (for conditional requests) is returned as is.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        last_attempt = attempt == RETRY_ATTEMPTS - 1
+        try:
+            response = await get_client().get(endpoint, params=params, headers=headers)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+        if response.status_code in RETRY_STATUS_CODES and not last_attempt:
+            await asyncio.sleep(_retry_delay(attempt, response))
+            continue
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
 async def _make_request(
     endpoint: str, 
     params: Optional[Dict[str, Any]] = None,
@@ -101,36 +257,87 @@ async def _make_request(
 ) -> Dict[str, Any]:
     """Make authenticated request to CourtListener API."""
     
+    cache_key = _get_cache_key(endpoint, params or {})
+    cache_ttl = ENDPOINT_CACHE_TTL.get(endpoint, cache_ttl)
+    
+    redis_client = get_redis()
+    if redis_client is not None:
+        try:
+            return await _make_shared_request(redis_client, endpoint, params, cache_key, use_cache, cache_ttl)
+        except RedisError as e:
+            print(f"[WARN] Redis unavailable, using in-process rate limit and cache: {e}")
+    
     if not _check_rate_limit():
         raise Exception("CourtListener API daily rate limit exceeded (5,000 requests)")
     
     # Check cache
-    cache_key = _get_cache_key(endpoint, params or {})
+    validators = None
     if use_cache and cache_key in _request_cache:
-        cached = _request_cache[cache_key]
-        if datetime.now().timestamp() - cached["timestamp"] < cache_ttl:
-            return cached["data"]
+        expires_at, cached, validators = _request_cache[cache_key]
+        if expires_at > time.monotonic():
+            _request_cache.move_to_end(cache_key)
+            return cached
+        if validators is None:
+            del _request_cache[cache_key]  # expired
+    
+    # Expired entries with validators are revalidated; a 304 reuses the cached data
+    response = await _get_with_retry(endpoint, params, headers=validators)
+    _increment_rate_limit()
     
-    # Build request
-    url = f"{COURTLISTENER_API_BASE}/{endpoint}"
-    headers = {}
+    if response.status_code == 304:
+        data = cached
+    else:
+        data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+        validators = _validators(response) if endpoint.startswith(REVALIDATE_ENDPOINT_PREFIXES) else None
     
-    if COURTLISTENER_API_TOKEN:
-        headers["Authorization"] = f"Token {COURTLISTENER_API_TOKEN}"
+    # Cache response
+    if use_cache:
+        _request_cache[cache_key] = (time.monotonic() + cache_ttl, data, validators)
+        _request_cache.move_to_end(cache_key)
+        while len(_request_cache) > REQUEST_CACHE_MAX_ENTRIES:
+            _request_cache.popitem(last=False)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
+    return data
+
+async def _make_shared_request(
+    redis_client,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    cache_key: Tuple,
+    use_cache: bool,
+    cache_ttl: int
+) -> Dict[str, Any]:
+    """_make_request against the Redis-backed rate limit and cache.
     
-    _increment_rate_limit()
+    The limit is a fixed-window counter per local day (INCR + EXPIRE in one
+    pipeline), and responses are cached as the raw JSON body with a TTL.
+    """
+    redis_key = f"cl:cache:{cache_key!r}"
+    if use_cache:
+        cached = await redis_client.get(redis_key)
+        if cached is not None:
+            return orjson.loads(cached) if ORJSON_AVAILABLE else json.loads(cached)
+    
+    day = time.strftime("%Y%m%d")
+    counter_key = f"cl:rl:{day}"
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.incr(counter_key)
+        pipe.expire(counter_key, 2 * 24 * 3600)
+        count, _ = await pipe.execute()
+    # Mirror the shared count locally for get_rate_limit_status
+    _roll_rate_limit_day()
+    _rate_limit_counter["count"] = count
+    if count > DAILY_RATE_LIMIT:
+        raise Exception("CourtListener API daily rate limit exceeded (5,000 requests)")
+    
+    response = await _get_with_retry(endpoint, params)
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
     
-    # Cache response
     if use_cache:
-        _request_cache[cache_key] = {
-            "data": data,
-            "timestamp": datetime.now().timestamp()
-        }
+        try:
+            await redis_client.set(redis_key, response.content, ex=max(1, int(cache_ttl)))
+        except RedisError as e:
+            print(f"[WARN] Failed to cache CourtListener response in Redis: {e}")
     
     return data
 
@@ -169,6 +376,7 @@ async def search_opinions(
         "order_by": order_by,
         "page": page,
         "page_size": min(page_size, 100),  # API max is 100
+        "fields": SEARCH_RESULT_FIELDS,
     }
     
     if court:
@@ -197,6 +405,8 @@ async def search_opinions(
     
     opinions = []
     for result in data.get("results", []):
+        # CourtListener sends judges as one comma-joined string
+        judge = result.get("judge")
         opinions.append(Opinion(
             id=str(result.get("id")),
             case_name=result.get("caseName", ""),
@@ -209,7 +419,7 @@ async def search_opinions(
             precedential_status=result.get("precedentialStatus", ""),
             absolute_url=result.get("absolute_url", ""),
             text_excerpt=result.get("snippet", ""),
-            judges=result.get("judge", "").split(",") if result.get("judge") else None
+            judges=judge.split(",") if judge else None
         ))
     
     return SearchResult(
@@ -345,7 +555,24 @@ async def fetch_opinions_for_etl(
     batch_size: int = 100
 ) -> List[Dict[str, Any]]:
     """
-    Fetch opinions for ETL pipeline.
+    Fetch opinions for ETL pipeline as legal_cases rows.
+    
+    See fetch_opinion_columns_for_etl for arguments.
+    """
+    columns = await fetch_opinion_columns_for_etl(jurisdiction, case_type, days_back, batch_size)
+    return opinion_columns_to_records(columns)
+
+async def fetch_opinion_columns_for_etl(
+    jurisdiction: str,
+    case_type: str = "civil",
+    days_back: int = 30,
+    batch_size: int = 100
+) -> Dict[str, List[Any]]:
+    """
+    Fetch opinions for ETL pipeline in columnar form (one list per field).
+    
+    Use opinion_columns_to_records to zip the columns into rows at the
+    serialization boundary.
     
     Args:
         jurisdiction: State or federal circuit (e.g., 'ca' for California)
@@ -354,48 +581,67 @@ async def fetch_opinions_for_etl(
         batch_size: Number of results per batch
     """
     
-    all_opinions = []
-    page = 1
-    
-    while True:
-        result = await search_opinions(
+    def fetch_page(page: int):
+        return search_opinions(
             query=f"type:{case_type}",
             court=jurisdiction,
             filed_after_relative=days_back,
             page=page,
             page_size=batch_size
         )
+    
+    # The first page tells us how many pages exist; fetch the rest concurrently
+    first = await fetch_page(1)
+    results = [first]
+    if first.next_page:
+        page_size = min(batch_size, 100)
+        num_pages = min(ETL_MAX_PAGES, max(2, math.ceil(first.count / page_size)))
+        semaphore = asyncio.Semaphore(ETL_PAGE_CONCURRENCY)
         
-        for opinion in result.opinions:
-            all_opinions.append({
-                "case_id": f"CL-{opinion.id}",
-                "case_name": opinion.case_name,
-                "court": opinion.court,
-                "jurisdiction": jurisdiction,
-                "case_type": case_type,
-                "decision_date": opinion.date_filed,
-                "citation_count": opinion.citation_count,
-                "summary": opinion.text_excerpt,
-                "source_url": f"https://www.courtlistener.com{opinion.absolute_url}",
-                "judges": opinion.judges,
-                "metadata": {
-                    "courtlistener_id": opinion.id,
-                    "docket_number": opinion.docket_number,
-                    "precedential_status": opinion.precedential_status,
-                    "status": opinion.status
-                }
-            })
-        
-        if not result.next_page:
-            break
-        
-        page += 1
+        async def fetch_bounded(page: int):
+            async with semaphore:
+                return await fetch_page(page)
         
-        # Safety limit
-        if page > 10:
-            break
-    
-    return all_opinions
+        pages = range(2, num_pages + 1)
+        # A failed page (e.g. out of range because the count shrank) is
+        # skipped rather than discarding every page fetched alongside it
+        page_results = await asyncio.gather(*(fetch_bounded(p) for p in pages), return_exceptions=True)
+        for page, result in zip(pages, page_results):
+            if isinstance(result, Exception):
+                print(f"[WARN] Skipping CourtListener page {page} for {jurisdiction}: {result}")
+            else:
+                results.append(result)
+    
+    opinions = [opinion for result in results for opinion in result.opinions]
+    return {
+        "case_id": [f"CL-{o.id}" for o in opinions],
+        "case_name": [o.case_name for o in opinions],
+        "court": [o.court for o in opinions],
+        "jurisdiction": [jurisdiction] * len(opinions),
+        "case_type": [case_type] * len(opinions),
+        "decision_date": [o.date_filed for o in opinions],
+        "citation_count": [o.citation_count for o in opinions],
+        "summary": [o.text_excerpt for o in opinions],
+        "source_url": [f"https://www.courtlistener.com{o.absolute_url}" for o in opinions],
+        "judges": [o.judges for o in opinions],
+        "courtlistener_id": [o.id for o in opinions],
+        "docket_number": [o.docket_number for o in opinions],
+        "precedential_status": [o.precedential_status for o in opinions],
+        "status": [o.status for o in opinions],
+    }
+
+# Columns folded into each row's "metadata" dict by opinion_columns_to_records
+_METADATA_COLUMNS = ("courtlistener_id", "docket_number", "precedential_status", "status")
+
+def opinion_columns_to_records(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Zip fetch_opinion_columns_for_etl output into legal_cases rows."""
+    row_fields = [name for name in columns if name not in _METADATA_COLUMNS]
+    rows = zip(*(columns[name] for name in row_fields))
+    metadata = zip(*(columns[name] for name in _METADATA_COLUMNS))
+    return [
+        {**dict(zip(row_fields, row)), "metadata": dict(zip(_METADATA_COLUMNS, meta))}
+        for row, meta in zip(rows, metadata)
+    ]
 
 def get_rate_limit_status() -> Dict[str, Any]:
     """Get current rate limit status."""
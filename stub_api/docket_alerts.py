@@ -12,15 +12,26 @@ Features:
 - Rolling window filtering
 """
 
-import os
+import re
+import sys
 import json
-import hashlib
+import time
+import heapq
+import secrets
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Deque, Set, Tuple, Type, TypeVar
+from collections import deque
+from itertools import islice
+from dataclasses import dataclass
 from enum import Enum
 import asyncio
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Alert types
 class AlertType(str, Enum):
     NEW_FILING = "new_filing"
@@ -43,7 +54,24 @@ class DeliveryMethod(str, Enum):
     WEBHOOK = "webhook"
     SMS = "sms"
 
-@dataclass
+E = TypeVar("E", bound=Enum)
+
+def _enum_list(enum_cls: Type[E], values: List[Any]) -> List[E]:
+    """Coerce values to enum_cls members with direct value lookups.
+    
+    Members are str subclasses, so they look themselves up too. On a miss
+    the enum constructor runs so bad values still raise its ValueError.
+    """
+    lookup = enum_cls._value2member_map_
+    try:
+        return [lookup[v] for v in values]
+    except (KeyError, TypeError):
+        return [enum_cls(v) for v in values]
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 the records keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class DocketSubscription:
     id: str
     user_id: str
@@ -59,8 +87,9 @@ class DocketSubscription:
     created_at: str
     last_checked: str
     active: bool = True
+    deactivated_at: Optional[str] = None  # When active last went False
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocketAlert:
     id: str
     subscription_id: str
@@ -79,13 +108,43 @@ class DocketAlert:
 # In-memory storage (use database in production)
 _subscriptions: Dict[str, DocketSubscription] = {}
 _alerts: Dict[str, DocketAlert] = {}
-_alert_queue: List[DocketAlert] = []
+_alert_queue: Deque[DocketAlert] = deque()  # FIFO; popleft() is O(1)
+
+# Secondary indexes in creation order (id -> record), kept in sync with the
+# stores so per-user/per-case lookups only touch matching records.
+# Deactivated subscriptions stay indexed, like in _subscriptions, until
+# sweep_stores drops them.
+_subs_by_user: Dict[str, Dict[str, DocketSubscription]] = {}
+_subs_by_case: Dict[str, Dict[str, DocketSubscription]] = {}
+_alerts_by_user: Dict[str, Dict[str, DocketAlert]] = {}
+
+# Max alerts per webhook POST when deliver_alerts batches by endpoint, and
+# max sends deliver_alerts keeps in flight
+WEBHOOK_BATCH_SIZE = 100
+DELIVERY_CONCURRENCY = 50
+
+# Delivery retries: deliver_alerts calls an alert gets before a failing
+# channel is given up, plus per queued alert the channels still owed
+# (absent = all of the subscription's channels) and attempts made so far
+MAX_DELIVERY_ATTEMPTS = 5
+_pending_channels: Dict[str, Set[DeliveryMethod]] = {}
+_delivery_attempts: Dict[str, int] = {}
+
+# Store bounds: at most ALERT_STORE_MAX alerts (see _evict_alerts), and
+# sweep_stores drops alerts older than ALERT_MAX_AGE_DAYS and subscriptions
+# deactivated more than INACTIVE_SUBSCRIPTION_MAX_AGE_DAYS ago
+ALERT_STORE_MAX = 100_000
+ALERT_MAX_AGE_DAYS = 30
+INACTIVE_SUBSCRIPTION_MAX_AGE_DAYS = 30
+STORE_GC_INTERVAL_SECONDS = 3600
+
+# Shared webhook connection pool, created lazily per event loop
+_webhook_client = None
+_webhook_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
 def generate_id(prefix: str = "alert") -> str:
-    """Generate unique ID."""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    random_part = hashlib.md5(f"{timestamp}{os.urandom(8).hex()}".encode()).hexdigest()[:8]
-    return f"{prefix}_{timestamp}_{random_part}"
+    """Generate unique ID (nanosecond timestamp plus 8 random hex chars)."""
+    return f"{prefix}_{time.time_ns()}_{secrets.token_hex(4)}"
 
 # Subscription Management
 def create_subscription(
@@ -102,6 +161,7 @@ def create_subscription(
 ) -> DocketSubscription:
     """Create a new docket monitoring subscription."""
     sub_id = generate_id("sub")
+    now_iso = datetime.now().isoformat()
     
     subscription = DocketSubscription(
         id=sub_id,
@@ -111,21 +171,38 @@ def create_subscription(
         court=court,
         jurisdiction=jurisdiction,
         docket_number=docket_number,
-        alert_types=[AlertType(t) for t in alert_types],
-        delivery_methods=[DeliveryMethod(m) for m in delivery_methods],
+        alert_types=_enum_list(AlertType, alert_types),
+        delivery_methods=_enum_list(DeliveryMethod, delivery_methods),
         webhook_url=webhook_url,
         game_theory_params=game_theory_params,
-        created_at=datetime.now().isoformat(),
-        last_checked=datetime.now().isoformat(),
+        created_at=now_iso,
+        last_checked=now_iso,
         active=True
     )
     
     _subscriptions[sub_id] = subscription
+    _subs_by_user.setdefault(user_id, {})[sub_id] = subscription
+    _subs_by_case.setdefault(case_id, {})[sub_id] = subscription
     return subscription
 
+def _reindex_subscription(
+    index: Dict[str, Dict[str, DocketSubscription]],
+    sub: DocketSubscription,
+    old_key: str,
+    new_key: str,
+    attr: str
+):
+    """Move sub between index buckets, keeping the new bucket in creation order."""
+    bucket = index.get(old_key)
+    if bucket is not None:
+        bucket.pop(sub.id, None)
+        if not bucket:
+            del index[old_key]
+    index[new_key] = {sid: s for sid, s in _subscriptions.items() if getattr(s, attr) == new_key}
+
 def get_user_subscriptions(user_id: str) -> List[DocketSubscription]:
     """Get all subscriptions for a user."""
-    return [s for s in _subscriptions.values() if s.user_id == user_id and s.active]
+    return [s for s in _subs_by_user.get(user_id, {}).values() if s.active]
 
 def get_subscription(subscription_id: str) -> Optional[DocketSubscription]:
     """Get a specific subscription."""
@@ -140,44 +217,56 @@ def update_subscription(
     if not sub:
         return None
     
+    old_user_id, old_case_id, was_active = sub.user_id, sub.case_id, sub.active
     for key, value in updates.items():
         if hasattr(sub, key):
             if key == "alert_types":
-                value = [AlertType(t) for t in value]
+                value = _enum_list(AlertType, value)
             elif key == "delivery_methods":
-                value = [DeliveryMethod(m) for m in value]
+                value = _enum_list(DeliveryMethod, value)
             setattr(sub, key, value)
     
+    if sub.active != was_active:
+        sub.deactivated_at = None if sub.active else datetime.now().isoformat()
+    if sub.user_id != old_user_id:
+        _reindex_subscription(_subs_by_user, sub, old_user_id, sub.user_id, "user_id")
+    if sub.case_id != old_case_id:
+        _reindex_subscription(_subs_by_case, sub, old_case_id, sub.case_id, "case_id")
+    
     return sub
 
 def delete_subscription(subscription_id: str) -> bool:
     """Delete (deactivate) a subscription."""
     sub = _subscriptions.get(subscription_id)
     if sub:
-        sub.active = False
+        if sub.active:
+            sub.active = False
+            sub.deactivated_at = datetime.now().isoformat()
         return True
     return False
 
 # Alert Generation
+# Alert priority by type; anything not listed is MEDIUM
+_PRIORITY = {
+    AlertType.ORDER_ISSUED: AlertPriority.HIGH,
+    AlertType.NASH_RECALCULATION: AlertPriority.HIGH,
+    AlertType.DEADLINE_APPROACHING: AlertPriority.HIGH,
+    AlertType.STRATEGY_CHANGE: AlertPriority.URGENT,
+}
+
 def create_alert(
     subscription: DocketSubscription,
     alert_type: AlertType,
     title: str,
     message: str,
     filing_details: Optional[Dict[str, Any]] = None,
-    nash_update: Optional[Dict[str, Any]] = None
+    nash_update: Optional[Dict[str, Any]] = None,
+    created_at: Optional[str] = None
 ) -> DocketAlert:
-    """Create a new alert."""
+    """Create a new alert (created_at defaults to now, in ISO format)."""
     alert_id = generate_id("alert")
     
-    # Determine priority
-    priority = AlertPriority.MEDIUM
-    if alert_type in [AlertType.ORDER_ISSUED, AlertType.NASH_RECALCULATION]:
-        priority = AlertPriority.HIGH
-    elif alert_type == AlertType.STRATEGY_CHANGE:
-        priority = AlertPriority.URGENT
-    elif alert_type == AlertType.DEADLINE_APPROACHING:
-        priority = AlertPriority.HIGH
+    priority = _PRIORITY.get(alert_type, AlertPriority.MEDIUM)
     
     alert = DocketAlert(
         id=alert_id,
@@ -190,12 +279,16 @@ def create_alert(
         message=message,
         filing_details=filing_details,
         nash_update=nash_update,
-        created_at=datetime.now().isoformat()
+        created_at=created_at or datetime.now().isoformat()
     )
     
     _alerts[alert_id] = alert
+    _alerts_by_user.setdefault(alert.user_id, {})[alert_id] = alert
     _alert_queue.append(alert)
     
+    if len(_alerts) > ALERT_STORE_MAX:
+        _evict_alerts()
+    
     return alert
 
 def get_user_alerts(
@@ -204,15 +297,14 @@ def get_user_alerts(
     limit: int = 50
 ) -> List[DocketAlert]:
     """Get alerts for a user."""
-    alerts = [a for a in _alerts.values() if a.user_id == user_id]
+    # Newest first, so alerts sharing a created_at keep newest-first order
+    alerts = reversed(_alerts_by_user.get(user_id, {}).values())
     
     if unread_only:
-        alerts = [a for a in alerts if not a.read]
+        alerts = (a for a in alerts if not a.read)
     
-    # Sort by created_at descending
-    alerts.sort(key=lambda x: x.created_at, reverse=True)
-    
-    return alerts[:limit]
+    # Newest `limit` alerts by created_at, without sorting the rest
+    return heapq.nlargest(limit, alerts, key=lambda x: x.created_at)
 
 def mark_alert_read(alert_id: str) -> bool:
     """Mark an alert as read."""
@@ -225,8 +317,8 @@ def mark_alert_read(alert_id: str) -> bool:
 def mark_all_read(user_id: str) -> int:
     """Mark all alerts for a user as read."""
     count = 0
-    for alert in _alerts.values():
-        if alert.user_id == user_id and not alert.read:
+    for alert in _alerts_by_user.get(user_id, {}).values():
+        if not alert.read:
             alert.read = True
             count += 1
     return count
@@ -239,10 +331,13 @@ async def process_new_filing(
 ) -> List[DocketAlert]:
     """Process a new filing and trigger Nash recalculation if needed."""
     alerts_created = []
+    # One timestamp for every alert raised by this filing
+    now_iso = datetime.now().isoformat()
     
     # Find all subscriptions for this case
-    subscriptions = [s for s in _subscriptions.values() 
-                    if s.case_id == case_id and s.active]
+    subscriptions = [s for s in _subs_by_case.get(case_id, {}).values() if s.active]
+    # Depends only on the filing, so decide once for every subscription
+    should_recalc = should_recalculate_nash(filing_type, filing_details)
     
     for sub in subscriptions:
         # Create basic filing alert
@@ -252,17 +347,18 @@ async def process_new_filing(
                 alert_type=AlertType.NEW_FILING,
                 title=f"New Filing: {filing_type}",
                 message=f"A new {filing_type} was filed in {sub.case_name}",
-                filing_details=filing_details
+                filing_details=filing_details,
+                created_at=now_iso
             )
             alerts_created.append(alert)
         
         # Check if Nash recalculation is needed
         if (AlertType.NASH_RECALCULATION in sub.alert_types and 
             sub.game_theory_params and
-            should_recalculate_nash(filing_type, filing_details)):
+            should_recalc):
             
             # Recalculate Nash equilibrium
-            nash_result = await recalculate_nash(sub, filing_details)
+            nash_result = recalculate_nash(sub, filing_details, recalculated_at=now_iso)
             
             if nash_result:
                 # Check if strategy changed
@@ -274,34 +370,54 @@ async def process_new_filing(
                     title="Strategy Update" if strategy_changed else "Nash Equilibrium Recalculated",
                     message=nash_result.get("summary", "Game theory analysis updated based on new filing"),
                     filing_details=filing_details,
-                    nash_update=nash_result
+                    nash_update=nash_result,
+                    created_at=now_iso
                 )
                 alerts_created.append(alert)
     
     return alerts_created
 
+# Filing types that significantly impact case strategy
+SIGNIFICANT_FILINGS = (
+    "motion_for_summary_judgment",
+    "motion_to_dismiss",
+    "settlement_offer",
+    "expert_report",
+    "deposition_transcript",
+    "order",
+    "ruling",
+    "verdict",
+    "damages_calculation",
+    "amended_complaint"
+)
+
+# One pass over the filing type instead of a substring scan per entry
+_SIGNIFICANT_FILING_RE = re.compile("|".join(map(re.escape, SIGNIFICANT_FILINGS)))
+
 def should_recalculate_nash(filing_type: str, filing_details: Dict[str, Any]) -> bool:
     """Determine if a filing should trigger Nash recalculation."""
-    # Filing types that significantly impact case strategy
-    significant_filings = [
-        "motion_for_summary_judgment",
-        "motion_to_dismiss",
-        "settlement_offer",
-        "expert_report",
-        "deposition_transcript",
-        "order",
-        "ruling",
-        "verdict",
-        "damages_calculation",
-        "amended_complaint"
-    ]
-    
     filing_type_lower = filing_type.lower().replace(" ", "_")
-    return any(sf in filing_type_lower for sf in significant_filings)
+    return _SIGNIFICANT_FILING_RE.search(filing_type_lower) is not None
+
+# Kept scalar on purpose: gathering a filing's subscriptions into NumPy
+# arrays costs more than these few float ops, and per-subscription time is
+# dominated by building the Nash update dict and its strings.
+def _nash_core(
+    win_prob: float,
+    judgment: float,
+    trial_costs: float,
+    settlement: float,
+    win_prob_adjustment: float
+) -> Tuple[float, float, bool]:
+    """Return (new win probability, trial EV, whether trial beats settlement)."""
+    new_win_prob = max(0.05, min(0.95, win_prob + win_prob_adjustment))
+    trial_ev = (new_win_prob * judgment) - trial_costs
+    return new_win_prob, trial_ev, trial_ev > settlement
 
-async def recalculate_nash(
+def recalculate_nash(
     subscription: DocketSubscription,
-    filing_details: Dict[str, Any]
+    filing_details: Dict[str, Any],
+    recalculated_at: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
     """Recalculate Nash equilibrium based on new filing."""
     if not subscription.game_theory_params:
@@ -330,20 +446,19 @@ async def recalculate_nash(
         current_judgment = params.get("expected_judgment", 100000)
         params["expected_judgment"] = current_judgment + damages_adjustment
     
-    # Apply win probability adjustment
-    current_win_prob = params.get("win_probability", 0.5)
-    new_win_prob = max(0.05, min(0.95, current_win_prob + win_prob_adjustment))
-    params["win_probability"] = new_win_prob
-    
-    # Calculate new Nash equilibrium
+    # Apply win probability adjustment and calculate new Nash equilibrium
     settlement = params.get("settlement_offer", 50000)
-    judgment = params.get("expected_judgment", 100000)
-    trial_costs = params.get("trial_costs", 25000)
-    
-    trial_ev = (new_win_prob * judgment) - trial_costs
+    new_win_prob, trial_ev, choose_trial = _nash_core(
+        params.get("win_probability", 0.5),
+        params.get("expected_judgment", 100000),
+        params.get("trial_costs", 25000),
+        settlement,
+        win_prob_adjustment
+    )
+    params["win_probability"] = new_win_prob
     
     # Determine optimal strategy
-    if trial_ev > settlement:
+    if choose_trial:
         new_strategy = "trial"
         recommendation = f"Continue to trial. Expected value (${trial_ev:,.0f}) exceeds settlement (${settlement:,.0f})."
     else:
@@ -367,66 +482,289 @@ async def recalculate_nash(
         "summary": f"Strategy {'changed to' if strategy_changed else 'remains'} {new_strategy}. "
                    f"Win probability: {new_win_prob:.0%}, Trial EV: ${trial_ev:,.0f}, Settlement: ${settlement:,.0f}",
         "triggered_by": filing_details.get("type", "unknown filing"),
-        "recalculated_at": datetime.now().isoformat()
+        "recalculated_at": recalculated_at or datetime.now().isoformat()
     }
 
 # Alert Delivery
-async def deliver_alerts():
-    """Process and deliver queued alerts."""
+async def deliver_alerts(batch_size: int = WEBHOOK_BATCH_SIZE):
+    """Process and deliver queued alerts.
+    
+    All deliveries run concurrently (at most DELIVERY_CONCURRENCY at once), so
+    a slow channel does not hold up the others. Webhook alerts are grouped by
+    webhook_url and POSTed as JSON arrays of up to batch_size alerts over the
+    shared webhook client (any non-2xx response is a failure).
+    
+    An alert is marked delivered only if all its sends succeed. Otherwise it
+    is requeued and the next call retries just the channels that failed, up
+    to MAX_DELIVERY_ATTEMPTS calls; a 4xx other than 429 is permanent and
+    that channel is dropped at once. Dropped channels are logged.
+    """
+    alerts: List[DocketAlert] = []
+    # (alerts covered, delivery method, label for logs, send coroutine)
+    deliveries = []
+    webhook_batches: Dict[str, List[DocketAlert]] = {}
+    
     while _alert_queue:
-        alert = _alert_queue.pop(0)
+        alert = _alert_queue.popleft()
         subscription = _subscriptions.get(alert.subscription_id)
+        pending = _pending_channels.pop(alert.id, None)
         
         if not subscription:
+            _delivery_attempts.pop(alert.id, None)
             continue
         
+        alerts.append(alert)
         for method in subscription.delivery_methods:
-            try:
-                if method == DeliveryMethod.IN_APP:
-                    # Already stored in _alerts
-                    pass
-                elif method == DeliveryMethod.EMAIL:
-                    await send_email_alert(alert, subscription)
-                elif method == DeliveryMethod.WEBHOOK:
-                    await send_webhook_alert(alert, subscription)
-                elif method == DeliveryMethod.SMS:
-                    await send_sms_alert(alert, subscription)
-            except Exception as e:
-                print(f"Failed to deliver alert {alert.id} via {method}: {e}")
+            if pending is not None and method not in pending:
+                continue
+            
+            if method == DeliveryMethod.WEBHOOK:
+                if subscription.webhook_url:
+                    webhook_batches.setdefault(subscription.webhook_url, []).append(alert)
+                continue
+            
+            # In-app alerts are already stored in _alerts, so have no sender
+            send = _DELIVERY.get(method)
+            if send is not None:
+                deliveries.append(([alert], method, method.value, send(alert, subscription)))
+    
+    semaphore = asyncio.Semaphore(DELIVERY_CONCURRENCY)
+    
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    if webhook_batches:
+        client = get_webhook_client()
+        for url, batch in webhook_batches.items():
+            for start in range(0, len(batch), batch_size):
+                chunk = batch[start:start + batch_size]
+                deliveries.append((
+                    chunk, DeliveryMethod.WEBHOOK, f"webhook {url}", send_webhook_batch(client, url, chunk)
+                ))
+    
+    results = await asyncio.gather(
+        *(bounded(coro) for _, _, _, coro in deliveries),
+        return_exceptions=True
+    )
+    
+    failed: Dict[str, Set[DeliveryMethod]] = {}
+    dropped: Set[str] = set()
+    for (covered, method, label, _), result in zip(deliveries, results):
+        if not isinstance(result, Exception):
+            continue
+        if _is_permanent_failure(result):
+            print(f"Dropping {len(covered)} alert(s) ({covered[0].id}...) via {label}, not retrying: {result}")
+            dropped.update(a.id for a in covered)
+        else:
+            print(f"Failed to deliver {len(covered)} alert(s) ({covered[0].id}...) via {label}: {result}")
+            for a in covered:
+                failed.setdefault(a.id, set()).add(method)
+    
+    retry = []
+    for alert in alerts:
+        methods = failed.get(alert.id)
+        if methods is None:
+            _delivery_attempts.pop(alert.id, None)
+            if alert.id not in dropped:
+                alert.delivered = True
+            continue
         
-        alert.delivered = True
+        attempts = _delivery_attempts.get(alert.id, 0) + 1
+        if attempts >= MAX_DELIVERY_ATTEMPTS:
+            _delivery_attempts.pop(alert.id, None)
+            print(f"Dropping alert {alert.id} after {attempts} failed attempt(s) via "
+                  f"{', '.join(sorted(m.value for m in methods))}")
+            continue
+        
+        _delivery_attempts[alert.id] = attempts
+        _pending_channels[alert.id] = methods
+        retry.append(alert)
+    
+    # Requeue in original order, ahead of anything queued meanwhile
+    _alert_queue.extendleft(reversed(retry))
+
+def _is_permanent_failure(error: Exception) -> bool:
+    """True for HTTP 4xx responses other than 429, which retrying won't fix."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status is not None and 400 <= status < 500 and status != 429
 
 async def send_email_alert(alert: DocketAlert, subscription: DocketSubscription):
     """Send alert via email."""
     # Integration with SendGrid or similar
     print(f"[EMAIL] Would send alert to user {subscription.user_id}: {alert.title}")
 
-async def send_webhook_alert(alert: DocketAlert, subscription: DocketSubscription):
-    """Send alert via webhook."""
+def _webhook_payload(alert: DocketAlert) -> Dict[str, Any]:
+    """Webhook JSON body for one alert."""
+    return {
+        "alert_id": alert.id,
+        "alert_type": alert.alert_type.value,
+        "case_id": alert.case_id,
+        "title": alert.title,
+        "message": alert.message,
+        "nash_update": alert.nash_update,
+        "created_at": alert.created_at
+    }
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode obj as JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def get_webhook_client():
+    """Return the shared webhook AsyncClient, so keep-alive connections are reused."""
+    global _webhook_client, _webhook_client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them
+    if _webhook_client is None or _webhook_client.is_closed or _webhook_client_loop is not loop:
+        import httpx
+        try:
+            import h2  # noqa: F401  (enables httpx HTTP/2)
+            http2 = True
+        except ImportError:
+            http2 = False
+        _webhook_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        _webhook_client_loop = loop
+    return _webhook_client
+
+async def close_webhook_client():
+    """Close the shared webhook AsyncClient (call on app shutdown)."""
+    global _webhook_client, _webhook_client_loop
+    if _webhook_client is not None:
+        await _webhook_client.aclose()
+    _webhook_client = None
+    _webhook_client_loop = None
+
+async def send_webhook_alert(alert: DocketAlert, subscription: DocketSubscription, client=None):
+    """Send alert via webhook (on client if given, else the shared webhook client)."""
     if not subscription.webhook_url:
         return
     
-    import httpx
-    async with httpx.AsyncClient() as client:
-        await client.post(
-            subscription.webhook_url,
-            json={
-                "alert_id": alert.id,
-                "alert_type": alert.alert_type.value,
-                "case_id": alert.case_id,
-                "title": alert.title,
-                "message": alert.message,
-                "nash_update": alert.nash_update,
-                "created_at": alert.created_at
-            },
-            timeout=10.0
-        )
+    client = client or get_webhook_client()
+    response = await client.post(
+        subscription.webhook_url,
+        content=_json_bytes(_webhook_payload(alert)),
+        headers=_JSON_HEADERS,
+        timeout=10.0
+    )
+    response.raise_for_status()
+
+async def send_webhook_batch(client, webhook_url: str, alerts: List[DocketAlert]):
+    """POST several alerts to one webhook as a JSON array."""
+    response = await client.post(
+        webhook_url,
+        content=_json_bytes([_webhook_payload(a) for a in alerts]),
+        headers=_JSON_HEADERS,
+        timeout=10.0
+    )
+    response.raise_for_status()
 
 async def send_sms_alert(alert: DocketAlert, subscription: DocketSubscription):
     """Send alert via SMS."""
     # Integration with Twilio or similar
     print(f"[SMS] Would send alert to user {subscription.user_id}: {alert.title}")
 
+# Per-alert senders used by deliver_alerts (webhooks are batched separately)
+_DELIVERY = {
+    DeliveryMethod.EMAIL: send_email_alert,
+    DeliveryMethod.SMS: send_sms_alert,
+}
+
+# Store Housekeeping
+def _remove_alert(alert_id: str):
+    """Drop an alert from _alerts and the per-user index."""
+    alert = _alerts.pop(alert_id, None)
+    if alert is None:
+        return
+    bucket = _alerts_by_user.get(alert.user_id)
+    if bucket is not None:
+        bucket.pop(alert_id, None)
+        if not bucket:
+            del _alerts_by_user[alert.user_id]
+
+def _remove_subscription(subscription_id: str):
+    """Drop a subscription from _subscriptions and the per-user/per-case indexes."""
+    sub = _subscriptions.pop(subscription_id, None)
+    if sub is None:
+        return
+    for index, key in ((_subs_by_user, sub.user_id), (_subs_by_case, sub.case_id)):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(subscription_id, None)
+            if not bucket:
+                del index[key]
+
+def _evict_alerts():
+    """Shrink _alerts to 90% of ALERT_STORE_MAX, oldest first.
+    
+    Read and delivered alerts go first, then delivered ones, then any. The
+    10% headroom means the scan runs once per ALERT_STORE_MAX // 10 inserts.
+    Evicted alerts still in _alert_queue leave it on the next sweep_stores.
+    """
+    excess = len(_alerts) - ALERT_STORE_MAX * 9 // 10
+    for evictable in (lambda a: a.read and a.delivered, lambda a: a.delivered, lambda a: True):
+        if excess <= 0:
+            return
+        victims = list(islice((aid for aid, a in _alerts.items() if evictable(a)), excess))
+        for alert_id in victims:
+            _remove_alert(alert_id)
+        excess -= len(victims)
+
+def sweep_stores(now: Optional[datetime] = None) -> Dict[str, int]:
+    """Drop expired alerts and long-deactivated subscriptions.
+    
+    Queued alerts that are no longer stored (expired or evicted) are dropped
+    from _alert_queue too, along with their retry state.
+    """
+    now = now or datetime.now()
+    
+    alert_cutoff = (now - timedelta(days=ALERT_MAX_AGE_DAYS)).isoformat()
+    expired = [aid for aid, a in _alerts.items() if a.created_at < alert_cutoff]
+    for alert_id in expired:
+        _remove_alert(alert_id)
+    
+    queued = len(_alert_queue)
+    keep = [a for a in _alert_queue if _alerts.get(a.id) is a]
+    if len(keep) != queued:
+        kept_ids = {a.id for a in keep}
+        for alert in _alert_queue:
+            if alert.id not in kept_ids:
+                _pending_channels.pop(alert.id, None)
+                _delivery_attempts.pop(alert.id, None)
+        _alert_queue.clear()
+        _alert_queue.extend(keep)
+    
+    sub_cutoff = (now - timedelta(days=INACTIVE_SUBSCRIPTION_MAX_AGE_DAYS)).isoformat()
+    stale = [
+        sid for sid, s in _subscriptions.items()
+        if not s.active and s.deactivated_at is not None and s.deactivated_at < sub_cutoff
+    ]
+    for subscription_id in stale:
+        _remove_subscription(subscription_id)
+    
+    return {
+        "alerts_removed": len(expired),
+        "queued_alerts_dropped": queued - len(keep),
+        "subscriptions_removed": len(stale)
+    }
+
+async def run_store_gc(interval_seconds: float = STORE_GC_INTERVAL_SECONDS):
+    """Run sweep_stores every interval_seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        removed = sweep_stores()
+        if any(removed.values()):
+            print(f"[INFO] Docket alerts GC removed {removed['alerts_removed']} alert(s), "
+                  f"{removed['queued_alerts_dropped']} queued alert(s), "
+                  f"{removed['subscriptions_removed']} subscription(s)")
+
 # Deadline Monitoring
 def check_deadlines(days_ahead: int = 7) -> List[DocketAlert]:
     """Check for approaching deadlines and create alerts."""
@@ -3,15 +3,21 @@ Email Alert Service for Legal Oracle
 Sends regulatory arbitrage alerts to subscribed users
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 import os
+import threading
 from datetime import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
+# smtplib, email.mime and sendgrid are imported where they are used, so
+# processes that never send email don't pay for them at startup
+if TYPE_CHECKING:
+    import smtplib
+
+# Set LEGAL_ORACLE_SKIP_DOTENV=1 when the environment is already populated
+if os.getenv("LEGAL_ORACLE_SKIP_DOTENV") != "1":
+    from dotenv import load_dotenv
+    load_dotenv()
 
 class AlertEmailService:
     """
@@ -26,6 +32,10 @@ class AlertEmailService:
         self.smtp_password = os.getenv('SMTP_PASSWORD', '')
         self.from_email = os.getenv('ALERT_FROM_EMAIL', 'alerts@legal-oracle.com')
         
+        # Logged-in SMTP connection reused across sends (see _get_smtp)
+        self._smtp: Optional["smtplib.SMTP"] = None
+        self._smtp_lock = threading.Lock()
+        
         # If SendGrid API key is provided, use SendGrid
         self.sendgrid_api_key = os.getenv('SENDGRID_API_KEY', '')
         self.use_sendgrid = bool(self.sendgrid_api_key)
@@ -76,12 +86,12 @@ class AlertEmailService:
         """Build HTML email template"""
         
         # Top opportunities (max 10)
-        rows = ""
+        row_parts = []
         for i, opp in enumerate(opportunities[:10], 1):
             score = opp.get('opportunity_score', 0)
             score_color = "#10b981" if score > 0.7 else "#f59e0b" if score > 0.4 else "#ef4444"
             
-            rows += f"""
+            row_parts.append(f"""
             <tr style="border-bottom: 1px solid #e5e7eb;">
                 <td style="padding: 16px; vertical-align: top;">
                     <div style="font-size: 16px; font-weight: 600; color: #111827; margin-bottom: 4px;">
@@ -103,7 +113,8 @@ class AlertEmailService:
                     </div>
                 </td>
             </tr>
-            """
+            """)
+        rows = "".join(row_parts)
         
         industry = preferences.get('industry', 'All Industries') if preferences else 'All Industries'
         
@@ -188,27 +199,27 @@ class AlertEmailService:
     
     def _build_email_text(self, opportunities: List[Dict]) -> str:
         """Build plain text version of email"""
-        text = f"""
+        parts = [f"""
 Legal Oracle - Regulatory Arbitrage Alerts
 ==========================================
 
 New Opportunities Detected: {len(opportunities)}
 
-"""
+"""]
         for i, opp in enumerate(opportunities[:10], 1):
-            text += f"""
+            parts.append(f"""
 {i}. {opp.get('title', 'Untitled')}
    Score: {opp.get('opportunity_score', 0):.2f} | Type: {opp.get('type', 'Unknown')} | Window: {opp.get('window_days', 'N/A')} days
    {opp.get('description', 'No description')[:150]}...
 
-"""
+""")
         
-        text += f"""
+        parts.append(f"""
 View all opportunities: https://legal-oracle.netlify.app/arbitrage
 
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
-"""
-        return text
+""")
+        return "".join(parts)
     
     def _send_via_sendgrid(self, to_email: str, subject: str, html_content: str) -> Dict:
         """Send email using SendGrid API"""
@@ -242,6 +253,10 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
         text_content: str
     ) -> Dict:
         """Send email using SMTP (Gmail, Outlook, etc.)"""
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        
         try:
             # Create message
             message = MIMEMultipart('alternative')
@@ -255,12 +270,16 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
             message.attach(part1)
             message.attach(part2)
             
-            # Send via SMTP
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                if self.smtp_username and self.smtp_password:
-                    server.login(self.smtp_username, self.smtp_password)
-                server.send_message(message)
+            # Send via SMTP, reconnecting once if the server dropped us
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    self._reset_smtp()
+                    self._get_smtp().send_message(message)
+                except Exception:
+                    self._reset_smtp()
+                    raise
             
             return {
                 "status": "sent",
@@ -276,6 +295,36 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
                 "to": to_email
             }
     
+    def _get_smtp(self) -> "smtplib.SMTP":
+        """Return the cached SMTP connection, connecting and logging in on first use"""
+        if self._smtp is None:
+            import smtplib
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                server.starttls()
+                if self.smtp_username and self.smtp_password:
+                    server.login(self.smtp_username, self.smtp_password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+    
+    def _reset_smtp(self):
+        """Drop the cached SMTP connection"""
+        if self._smtp is not None:
+            import smtplib
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+    
+    def close(self):
+        """Close the cached SMTP connection"""
+        with self._smtp_lock:
+            self._reset_smtp()
+    
     def send_test_email(self, to_email: str) -> Dict:
         """Send a test email to verify configuration"""
         test_opportunities = [
@@ -300,6 +349,12 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
         return self.send_arbitrage_alert(to_email, test_opportunities, {"industry": "Technology"})
 
 
+@lru_cache(maxsize=1)
+def _get_service() -> AlertEmailService:
+    """Shared AlertEmailService, so config and the SendGrid client are set up once."""
+    return AlertEmailService()
+
+
 # Utility function for easy access
 def send_alert(user_email: str, opportunities: List[Dict], preferences: Optional[Dict] = None) -> Dict:
     """
@@ -309,5 +364,4 @@ def send_alert(user_email: str, opportunities: List[Dict], preferences: Optional
         from email_service import send_alert
         result = send_alert("user@example.com", opportunities)
     """
-    service = AlertEmailService()
-    return service.send_arbitrage_alert(user_email, opportunities, preferences)
+    return _get_service().send_arbitrage_alert(user_email, opportunities, preferences)
@@ -1,5 +1,6 @@
 import os
 import json
+import asyncio
 from typing import List, Optional, Dict, Any, Tuple
 from fastapi import FastAPI, HTTPException, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -1832,6 +1833,9 @@ except ImportError as e:
     print(f"[WARN] Scheduled tasks not available: {e}")
     SCHEDULER_AVAILABLE = False
 
+# Periodic docket alert store sweep, started on startup
+_docket_gc_task = None
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize background tasks on server startup"""
@@ -1845,6 +1849,10 @@ async def startup_event():
             print("[WARN] Failed to start scheduler")
     else:
         print("[WARN] Scheduler not available - install apscheduler for background tasks")
+    
+    if DOCKET_ALERTS_AVAILABLE:
+        global _docket_gc_task
+        _docket_gc_task = asyncio.create_task(run_docket_store_gc())
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -1854,6 +1862,14 @@ async def shutdown_event():
     if SCHEDULER_AVAILABLE:
         stop_scheduler()
         print("[OK] Scheduler stopped")
+    
+    if COURTLISTENER_AVAILABLE:
+        await close_courtlistener_client()
+    
+    if DOCKET_ALERTS_AVAILABLE:
+        if _docket_gc_task is not None:
+            _docket_gc_task.cancel()
+        await close_webhook_client()
 
 # -------------------------
 # Alert System Endpoints
@@ -2195,7 +2211,8 @@ except ImportError:
 try:
     from courtlistener_api import (
         search_opinions, get_opinion, search_dockets, get_recent_filings,
-        get_rate_limit_status, fetch_opinions_for_etl
+        get_rate_limit_status, fetch_opinions_for_etl,
+        close_client as close_courtlistener_client
     )
     COURTLISTENER_AVAILABLE = True
 except ImportError:
@@ -2484,7 +2501,8 @@ try:
         create_subscription, get_user_subscriptions, get_subscription,
         update_subscription, delete_subscription, create_alert,
         get_user_alerts, mark_alert_read, mark_all_read,
-        process_new_filing, subscription_to_dict, alert_to_dict
+        process_new_filing, subscription_to_dict, alert_to_dict,
+        close_webhook_client, run_store_gc as run_docket_store_gc
     )
     DOCKET_ALERTS_AVAILABLE = True
 except ImportError:
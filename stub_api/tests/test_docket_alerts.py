@@ -0,0 +1,135 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+import docket_alerts as da
+
+
+@pytest.fixture(autouse=True)
+def reset_stores():
+    for store in (da._subscriptions, da._alerts, da._subs_by_user, da._subs_by_case, da._alerts_by_user):
+        store.clear()
+    da._alert_queue.clear()
+    da._pending_channels.clear()
+    da._delivery_attempts.clear()
+    yield
+    asyncio.run(da.close_webhook_client())
+
+
+def deliver_with(handler):
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        da._webhook_client = client
+        da._webhook_client_loop = asyncio.get_running_loop()
+        await da.deliver_alerts()
+    asyncio.run(run())
+
+
+def make_alerts(n, delivery_methods=("webhook",)):
+    sub = da.create_subscription(
+        "user_1", "case_1", "Doe v. Roe", "cand", "US-CA", "1:24-cv-1",
+        ["new_filing"], list(delivery_methods), webhook_url="https://hooks.example.com/alerts"
+    )
+    return [da.create_alert(sub, da.AlertType.NEW_FILING, "New Filing", "motion") for _ in range(n)]
+
+
+def test_webhook_server_error_keeps_alerts_undelivered():
+    alerts = make_alerts(3)
+
+    deliver_with(lambda request: httpx.Response(500))
+
+    assert all(a.delivered is False for a in alerts)
+    assert list(da._alert_queue) == alerts
+
+
+def test_webhook_success_marks_alerts_delivered():
+    alerts = make_alerts(3)
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200)
+
+    deliver_with(handler)
+
+    assert all(a.delivered is True for a in alerts)
+    assert not da._alert_queue
+    assert [p["alert_id"] for p in bodies[0]] == [a.id for a in alerts]
+
+
+@pytest.fixture
+def emails(monkeypatch):
+    sent = []
+
+    async def send_email(alert, subscription):
+        sent.append(alert.id)
+
+    monkeypatch.setitem(da._DELIVERY, da.DeliveryMethod.EMAIL, send_email)
+    return sent
+
+
+def test_failed_webhook_retries_only_the_webhook_until_the_cap(emails):
+    alert, = make_alerts(1, ("email", "webhook"))
+    posts = []
+
+    def handler(request):
+        posts.append(request)
+        return httpx.Response(503)
+
+    for _ in range(da.MAX_DELIVERY_ATTEMPTS + 2):
+        deliver_with(handler)
+
+    assert emails == [alert.id]
+    assert len(posts) == da.MAX_DELIVERY_ATTEMPTS
+    assert alert.delivered is False
+    assert not da._alert_queue
+    assert not da._pending_channels and not da._delivery_attempts
+
+
+def test_permanent_webhook_error_is_not_retried(emails):
+    alert, = make_alerts(1, ("email", "webhook"))
+    posts = []
+
+    def handler(request):
+        posts.append(request)
+        return httpx.Response(410)
+
+    deliver_with(handler)
+    deliver_with(handler)
+
+    assert emails == [alert.id]
+    assert len(posts) == 1
+    assert alert.delivered is False
+    assert not da._alert_queue
+
+
+def test_sweep_drops_expired_and_evicted_alerts_from_queue():
+    old, evicted, fresh = make_alerts(3)
+    old.created_at = (datetime.now() - timedelta(days=da.ALERT_MAX_AGE_DAYS + 1)).isoformat()
+    da._remove_alert(evicted.id)
+    da._delivery_attempts[evicted.id] = 2
+
+    removed = da.sweep_stores()
+
+    assert removed["alerts_removed"] == 1
+    assert removed["queued_alerts_dropped"] == 2
+    assert list(da._alert_queue) == [fresh]
+    assert not da._delivery_attempts
+
+
+def test_sweep_ages_inactive_subscriptions_from_deactivation():
+    alert, = make_alerts(1)
+    sub = da.get_subscription(alert.subscription_id)
+    sub.created_at = (datetime.now() - timedelta(days=60)).isoformat()
+    da.delete_subscription(sub.id)
+
+    assert da.sweep_stores()["subscriptions_removed"] == 0
+    assert da.update_subscription(sub.id, {"active": True}).deactivated_at is None
+
+    da.delete_subscription(sub.id)
+    later = datetime.now() + timedelta(days=da.INACTIVE_SUBSCRIPTION_MAX_AGE_DAYS + 1)
+    assert da.sweep_stores(later)["subscriptions_removed"] == 1
+    assert da.get_subscription(sub.id) is None